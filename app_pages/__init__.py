@@ -0,0 +1,34 @@
+import os
+import threading
+
+from instrumentation import ENABLED as PERF_ENABLED
+
+# One module per page, each with a render() function called by app.py
+PAGES = {
+    "🏠 Home": "app_pages.home",
+    "📂 Data Overview": "app_pages.data_overview",
+    "📈 EDA": "app_pages.eda",
+    "⚙️ Modeling": "app_pages.modeling",
+    "🔮 Make Predictions!": "app_pages.predictions",
+}
+# hidden unless the app is started with ATTRITION_PERF=1
+if PERF_ENABLED:
+    PAGES["⏱️ Performance"] = "app_pages.performance"
+
+# static files (audio, images) read once per process, keyed on path and mtime
+_assets = {}
+_lock = threading.Lock()
+
+
+def load_asset(path):
+    """Bytes of a static file, cached until the file changes on disk."""
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    data = _assets.get(key)
+    if data is None:
+        with open(path, 'rb') as asset_file:
+            data = asset_file.read()
+        with _lock:
+            for old_key in [k for k in _assets if k[0] == key[0]]:
+                del _assets[old_key]
+            _assets[key] = data
+    return data
@@ -0,0 +1,50 @@
+import streamlit as st
+
+from data_export import EXPORT_FORMATS, export_bytes, export_file_name, export_mime
+from data_loader import data_version, load_data
+from instrumentation import timed
+
+DATA_IMAGE_PATH = "images/data_overview.jpg"
+
+
+#build data overview page
+def render():
+    #read in the data (parsed once per process and shared across sessions)
+    with timed('data.load'):
+        df = load_data()
+    st.title("📂 Data Overview")
+    st.subheader("About the Data")
+    st.write("The dataset at hand encompasses a comprehensive set of attributes related to employees within our organization. These attributes include, but are not limited to, marital status, job title, compensation, education, and more. Each row represents a unique employee, and the primary objective of this dataset is to facilitate the prediction of employee attrition.")
+    st.image(DATA_IMAGE_PATH)
+    st.link_button("Click here to learn more", "https://www.kaggle.com/datasets/patelprashant/employee-attrition", help = "Employee Attrition Dataset Kaggle Page", type = 'primary')
+    st.subheader("Quick Glance at the Data")
+    # Display dataset
+    if st.checkbox("DataFrame"):
+        st.dataframe(df)
+    # Column list
+    if st.checkbox("Column List"):
+        st.code(f"Columns: {df.columns.tolist()}")
+        if st.toggle('Further breakdown of columns'):
+            with timed('data.select_dtypes'):
+                num_cols = df.select_dtypes(include = 'number').columns.tolist()
+                obj_cols = df.select_dtypes(include = ['object', 'category']).columns.tolist()
+            st.code(f"Numerical Columns: {num_cols} \nObject Columns: {obj_cols}")
+    # Shape
+    if st.checkbox("Shape"):
+        # st.write(f"The shape is {df.shape}") -- could write it out like this or do the next instead:
+        st.write(f"There are {df.shape[0]} rows and {df.shape[1]} columns.")
+
+    if st.checkbox("Download Data"):
+        # Pick what to export; each version of the data/options is only serialized once
+        export_cols = st.multiselect("Columns to export:", df.columns.tolist(), default=df.columns.tolist())
+        export_rows = st.selectbox("Rows to export:", ["All Employees", "Employees Who Left (Attrition = 1)", "Employees Who Stayed (Attrition = 0)"])
+        export_fmt = st.radio("File format:", list(EXPORT_FORMATS), horizontal=True)
+        export_filters = {"All Employees": None,
+                          "Employees Who Left (Attrition = 1)": {'attrition': [1]},
+                          "Employees Who Stayed (Attrition = 0)": {'attrition': [0]}}[export_rows]
+        if export_cols:
+            with timed('export.build'):
+                export_data = export_bytes(df, data_version(), export_fmt, export_cols, export_filters)
+            st.download_button(f"Download Data as {export_fmt}", export_data,
+                               file_name=export_file_name("employee_attrition_data", export_fmt),
+                               mime=export_mime(export_fmt))
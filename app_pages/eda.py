@@ -0,0 +1,68 @@
+import streamlit as st
+
+from data_loader import data_version, load_data
+from eda_charts import box_figure, histogram_figure, scatter_figure
+from instrumentation import plotly_chart, timed
+
+
+#build EDA page
+# Charts are built from server-side summaries (eda_charts.py), so only binned/sampled data reaches the browser
+def render():
+    #read in the data (parsed once per process and shared across sessions)
+    with timed('data.load'):
+        df = load_data()
+    st.title("📈 EDA")
+    with timed('data.select_dtypes'):
+        num_cols = df.select_dtypes(include='number').columns.tolist()
+        obj_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    eda_type = st.multiselect("What type of EDA are you interested in exploring?", ["Histogram", "Box Plot", "Scatterplot"])
+    version = data_version()
+
+    # HISTOGRAM
+    if "Histogram" in eda_type:
+        st.subheader("Histograms - Visualizing Numerical Distributions")
+        h_selected_col = st.selectbox("Select a numerical column for your Histogram:", num_cols, index=None)
+        if h_selected_col:
+            chart_title = f"Distribution of {' '.join(h_selected_col.split('_')).title()}"
+            if st.toggle("Attrition Hue on Histogram:"):
+                with timed('eda.histogram.build'):
+                    fig = histogram_figure(df, version, h_selected_col, chart_title, hue='attrition')
+                plotly_chart(fig, 'eda.histogram.render')
+            else:
+                with timed('eda.histogram.build'):
+                    fig = histogram_figure(df, version, h_selected_col, chart_title)
+                plotly_chart(fig, 'eda.histogram.render')
+
+    # BOXPLOT
+    if "Box Plot" in eda_type:
+        st.subheader("Boxplots - Visualizing Numerical Distributions")
+        b_selected_col = st.selectbox("Select a numerical column for your Boxplot:", num_cols, index=None)
+        if b_selected_col:
+            chart_title = f"Distribution of {' '.join(b_selected_col.split('_')).title()}"
+            if st.toggle("Attrition Hue On Box Plot"):
+                with timed('eda.box.build'):
+                    fig = box_figure(df, version, b_selected_col, chart_title, hue='attrition')
+                plotly_chart(fig, 'eda.box.render')
+            else:
+                with timed('eda.box.build'):
+                    fig = box_figure(df, version, b_selected_col, chart_title)
+                plotly_chart(fig, 'eda.box.render')
+
+    # SCATTERPLOT
+    if "Scatterplot" in eda_type:
+        st.subheader("Scatterplots - Visualizing Relationships")
+        selected_col_x = st.selectbox("Select x-axis variable:", num_cols, index=None)
+        selected_col_y = st.selectbox("Select y-axis variable:", num_cols, index=None)
+        if selected_col_x and selected_col_y:
+            chart_title = f"Relationship of {selected_col_x} vs {selected_col_y}"
+            density = st.radio("Show as:", ["Points", "Density"], horizontal=True) == "Density"
+            if st.toggle("Attrition Hue On Scatterplot"):
+                with timed('eda.scatter.build'):
+                    fig = scatter_figure(df, version, selected_col_x, selected_col_y, chart_title,
+                                               hue='attrition', density=density)
+                plotly_chart(fig, 'eda.scatter.render')
+            else:
+                with timed('eda.scatter.build'):
+                    fig = scatter_figure(df, version, selected_col_x, selected_col_y, chart_title,
+                                               density=density)
+                plotly_chart(fig, 'eda.scatter.render')
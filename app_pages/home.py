@@ -0,0 +1,23 @@
+import streamlit as st
+
+from app_pages import load_asset
+
+AUDIO_PATH = "audio/9to5dollypar.mp3"
+
+
+#build homepage
+def render():
+    st.title("💼 Employee Attrition Predictor")
+    # Audio File 9 to 5
+    st.write("🎶: 9 to 5 by Dolly Parton and Kelly Clarkson")
+    # bytes are read once per process; streamlit serves them as a media file url
+    st.audio(load_asset(AUDIO_PATH), format='audio/mp3', start_time=0)
+    st.subheader("This app is designed to effectively review the analytics and make predictions on employee attrition throughout the company.")
+    st.write("Please use the toggle bar on the left hand side of the page to navigate between the dataset, the analytics on current employees attrition, and making predictions on future employees attrition.")
+    
+    # Centered image
+    st.image("https://www.fintechfutures.com/files/2018/07/Busy-People-FOT-280x198.jpg", 
+         caption="Image Caption",
+         use_column_width=True,
+         output_format="auto",
+         width=0.5) 
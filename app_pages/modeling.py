@@ -0,0 +1,100 @@
+import pickle
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+from sklearn.metrics import ConfusionMatrixDisplay
+
+import online_model
+from data_loader import load_data
+from instrumentation import timed
+from model_evaluation import CV_FOLDS, all_model_configs, comparison_table, evaluate_model, evaluate_models, model_label
+
+
+def _drop_model_download():
+    st.session_state.pop('last_model_pkl', None)
+
+
+# Build Modeling Page
+# Fits run in a joblib worker pool and their metrics are memoized across sessions (see model_evaluation.py)
+def render():
+    #read in the data (parsed once per process and shared across sessions)
+    with timed('data.load'):
+        df = load_data()
+    st.title("⚙️ Modeling")
+    st.markdown("On this page, you can see how well different **machine learning** models make predictions on employee attrition:")
+    # Models evaluated so far this session, for the comparison table
+    evaluated = st.session_state.setdefault('evaluated_models', {})
+    # Model selection
+    model_option = st.selectbox("Select a Model:", ['KNN', 'Logistic Regression', 'Random Forest'], index=None)
+    if model_option:
+        if model_option == "KNN":
+            k_value = st.slider("Select the number of neighbors (k):", 1, 29, 5, 2)
+            params = {'n_neighbors': k_value}
+        else:
+            params = {}
+        # create a button & evaluate your model
+        if st.button("Let's see the performance!"):
+            with st.spinner("Fitting and cross-validating..."):
+                with timed('model.evaluate'):
+                    result, model = evaluate_model(df, model_option, params, keep_model=True)
+            evaluated[model_label(result)] = result
+            # only the model the user can download is kept, the rest are metrics
+            st.session_state['last_model'] = model
+            st.session_state.pop('last_model_pkl', None)
+            # Display results
+            st.subheader(f"{model} Evaluation")
+            st.text(f"Training Accuracy: {round(result['train_accuracy'] * 100, 2)}%")
+            st.text(f"Testing Accuracy: {round(result['test_accuracy'] * 100, 2)}%")
+            st.text(f"{CV_FOLDS}-Fold Cross-Validated Accuracy: {round(result['cv_accuracy_mean'] * 100, 2)}% "
+                    f"(± {round(result['cv_accuracy_std'] * 100, 2)}%)")
+            # Confusion Matrix
+            st.subheader("Confusion Matrix")
+            with timed('modeling.confusion_matrix'):
+                CM_display = ConfusionMatrixDisplay(result['confusion_matrix'], display_labels=[0, 1])
+                CM_display.plot(cmap='YlOrBr_r')
+                st.pyplot(CM_display.figure_)
+                plt.close(CM_display.figure_)
+
+    # Model comparison: every model (and KNN for every k on the slider) in one parallel pass
+    st.subheader("Compare Models")
+    if st.button("Compare all models (KNN k = 1-29, Logistic Regression, Random Forest)"):
+        with st.spinner("Evaluating all models in parallel..."):
+            with timed('model.evaluate_all'):
+                results = evaluate_models(df, all_model_configs())
+        for result in results:
+            evaluated[model_label(result)] = result
+        knn_sweep = pd.DataFrame({'k': [r['params']['n_neighbors'] for r in results if r['model_type'] == 'KNN'],
+                                  'CV Accuracy (%)': [r['cv_accuracy_mean'] * 100 for r in results if r['model_type'] == 'KNN']})
+        st.line_chart(knn_sweep, x='k', y='CV Accuracy (%)')
+    if evaluated:
+        st.dataframe(comparison_table(list(evaluated.values())), hide_index=True)
+
+    # pickled only on request (a KNN model holds its training data) and dropped once downloaded
+    if 'last_model' in st.session_state:
+        if 'last_model_pkl' not in st.session_state and st.button("Prepare Model Download"):
+            st.session_state['last_model_pkl'] = pickle.dumps(st.session_state['last_model'])
+            st.rerun()
+        if 'last_model_pkl' in st.session_state:
+            st.download_button("Download Model", st.session_state['last_model_pkl'], file_name="trained_model.pkl",
+                               mime="application/octet-stream", on_click=_drop_model_download)
+
+    # Incremental updates: an SGD logistic regression that only trains on rows appended since the last update
+    st.subheader("Incremental Model Updates")
+    st.write("New hires and leavers appended to the data file can be learned without retraining from scratch. Each update reads only the new rows and reports how accuracy on held-out employees has drifted.")
+    if st.button("Ingest New Records"):
+        with st.spinner("Updating the incremental model..."):
+            with timed('model.online_update'):
+                report = online_model.update()
+        if report['rows_added'] == 0:
+            st.info("No new records since the last update.")
+        else:
+            st.success(f"Learned from {report['rows_trained']} new records ({report['rows_added']} read) in {report['seconds']:.2f}s.")
+            if report['drift_detected']:
+                st.warning(f"Accuracy on the new records is {-report['drift']:.1%} below held-out accuracy. The data may be drifting.")
+    history = online_model.load_state()['history']
+    if history:
+        history_df = pd.DataFrame(history)[['updated_at', 'rows_added', 'total_rows', 'holdout_accuracy_after', 'new_rows_accuracy', 'drift']]
+        st.dataframe(history_df.rename(columns={'updated_at': 'Updated At', 'rows_added': 'New Rows', 'total_rows': 'Total Rows',
+                                                'holdout_accuracy_after': 'Held-Out Accuracy', 'new_rows_accuracy': 'Accuracy On New Rows',
+                                                'drift': 'Drift'}), hide_index=True)
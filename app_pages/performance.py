@@ -0,0 +1,44 @@
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from instrumentation import PROCESS, export_json, rss_mb, session_id, snapshot
+
+COLUMNS = {'stage': 'Stage', 'count': 'Calls', 'mean_ms': 'Mean (ms)', 'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)',
+           'max_ms': 'Max (ms)', 'total_s': 'Total (s)', 'rss_delta_max_mb': 'Max +RSS (MB)',
+           'payload_last_kb': 'Last Payload (KB)'}
+
+
+def _stage_table(rows):
+    table = pd.DataFrame(rows, columns=list(COLUMNS) + ['last_ms', 'payload_total_mb'])[list(COLUMNS)]
+    return table.rename(columns=COLUMNS).round(2)
+
+
+# Build Performance Page (only listed in the sidebar when ATTRITION_PERF=1)
+def render():
+    st.title("⏱️ Performance")
+    st.write("Timings and memory for each stage of the app: data loading, model fitting and prediction, and chart building/rendering. Process-wide numbers cover every session served by this server process.")
+    st.text(f"Resident memory: {rss_mb():.0f} MB | Active sessions tracked: {len(instrumentation._sessions)}")
+
+    st.subheader("Process-Wide")
+    process_rows = snapshot(PROCESS)
+    if process_rows:
+        st.dataframe(_stage_table(process_rows), hide_index=True)
+        st.bar_chart(pd.DataFrame(process_rows).set_index('stage')['total_s'])
+    else:
+        st.info("Nothing measured yet. Use the other pages first.")
+
+    st.subheader("This Session")
+    session_rows = snapshot(session_id())
+    if session_rows:
+        st.dataframe(_stage_table(session_rows), hide_index=True)
+
+    # Structured export of the aggregates
+    st.download_button("Download Metrics (JSON)", export_json(), file_name="attrition_app_metrics.json",
+                       mime="application/json")
+    if process_rows:
+        st.download_button("Download Metrics (CSV)", pd.DataFrame(process_rows).to_csv(index=False),
+                           file_name="attrition_app_metrics.csv", mime="text/csv")
+    if st.button("Reset Metrics"):
+        instrumentation.reset()
+        st.rerun()
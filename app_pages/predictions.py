@@ -0,0 +1,135 @@
+import io
+
+import pandas as pd
+import streamlit as st
+
+import online_model
+from batch_scoring import score_file
+from data_loader import load_data
+from instrumentation import timed
+from model_registry import get_model, predict, predict_proba
+
+MODEL_OPTIONS = ["Logistic Regression (retrained on all data)", "Incremental (learns only new records)"]
+
+
+def _drop_scored():
+    st.session_state.pop('scored_csv', None)
+    st.session_state.pop('scored_preview', None)
+
+
+# Predictions Page
+def render():
+    st.title("🔮 Make Employee Predictions")
+    st.write("This predictive model estimates the likelihood of employee attrition based on various factors. Adjust the sliders to input employee information, and the model will make a prediction.")
+    model_option = st.selectbox("Prediction Model:", MODEL_OPTIONS,
+                                help="The incremental model only trains on records appended to the data file since its last update, so it stays current without refitting on the whole history.")
+    # Create sliders for user to input data
+    age = st.slider("Age", min_value=18, max_value=60, value=30, step=1)
+    daily_rate = st.slider("Daily Rate", min_value=102, max_value=1499, value=800, step=1)
+    distance_from_home = st.slider("Distance From Home", min_value=1, max_value=29, value=15, step=1)
+    environment_satisfaction = st.slider("Environmental Satisfaction", min_value=1, max_value=4, value=2, step=1)
+    hourly_rate = st.slider("Hourly Rate", min_value=30, max_value=100, value=60, step=1)
+    job_involvement = st.slider("Job Involvement", min_value=1, max_value=4, value=2, step=1)
+    job_satisfaction = st.slider("Job Satisfaction", min_value=1, max_value=4, value=2, step=1)
+    monthly_income = st.slider("Monthly Income", min_value=1009, max_value=20000, value=10000, step=1)
+    monthly_rate = st.slider("Monthly Rate", min_value=2094, max_value=27000, value=10000, step=1)
+    num_companies_worked = st.slider("Number Of Companies Worked", min_value=0, max_value=9, value=5, step=1)
+    percent_salary_hike = st.slider("Percent Salary Hike", min_value=11, max_value=25, value=20, step=1)
+    performance_rating = st.slider("Performance Rating", min_value=3, max_value=4, value=4, step=1)
+    relationship_satisfaction = st.slider("Relationship Satisfaction", min_value=1, max_value=4, value=2, step=1)
+    stock_option_level = st.slider("Stock Option Level", min_value=0, max_value=3, value=1, step=1)
+    total_working_years = st.slider("Total Working Years", min_value=0, max_value=40, value=10, step=1)
+    training_times_last_year = st.slider("Training Time Last Year", min_value=0, max_value=6, value=3, step=1)
+    work_life_balance = st.slider("Work Life Balance", min_value=1, max_value=4, value=2, step=1)
+    years_at_company = st.slider("Years At Company", min_value=0, max_value=40, value=10, step=1)
+    years_in_current_role = st.slider("Years In Current Role", min_value=0, max_value=18, value=10, step=1)
+    years_since_last_promotion = st.slider("Years Since Last Promotion", min_value=0, max_value=15, value=10, step=1)
+    years_with_current_manager = st.slider("Years With Current Manager", min_value=0, max_value=17, value=10, step=1)
+
+    # Must be in order that the model was trained on
+
+    user_input_lr = pd.DataFrame({
+        'age': [age],
+        'dailyrate': [daily_rate],
+        'distancefromhome': [distance_from_home],
+        'environmentsatisfaction': [environment_satisfaction],
+        'hourlyrate': [hourly_rate],
+        'jobinvolvement': [job_involvement],
+        'jobsatisfaction': [job_satisfaction],
+        'monthlyincome': [monthly_income],
+        'monthlyrate': [monthly_rate],
+        'numcompaniesworked': [num_companies_worked],
+        'percentsalaryhike': [percent_salary_hike],
+        'performancerating': [performance_rating],
+        'relationshipsatisfaction': [relationship_satisfaction],
+        'stockoptionlevel': [stock_option_level],
+        'totalworkingyears': [total_working_years],
+        'trainingtimeslastyear': [training_times_last_year],
+        'worklifebalance': [work_life_balance],
+        'yearsatcompany': [years_at_company],
+        'yearsincurrentrole': [years_in_current_role],
+        'yearssincelastpromotion': [years_since_last_promotion],
+        'yearswithcurrmanager': [years_with_current_manager]
+    })
+
+    model_lr = None
+    if model_option == MODEL_OPTIONS[1]:
+        # Learns small appends before predicting; never trains on the whole history here (see online_model.py)
+        with timed('model.get_online'):
+            model_lr = online_model.current_model()
+        if model_lr is None:
+            st.warning("The incremental model hasn't been trained yet. Run `python online_model.py` (or \"Ingest New Records\" on the Modeling page) to train it. Using the logistic regression meanwhile.")
+        elif model_lr.pending_bytes is None:
+            st.info("The data file was rewritten since the incremental model last learned from it. Run `python online_model.py` to retrain it; its predictions are from the old data meanwhile.")
+        elif model_lr.pending_bytes:
+            st.info(f"{model_lr.pending_bytes / 1e6:.1f} MB of new records haven't been learned yet. Run `python online_model.py` to learn them.")
+    if model_lr is None:
+        #read in the data (parsed once per process and shared across sessions)
+        with timed('data.load'):
+            df = load_data()
+        # Fitted once per data version and shared across sessions (see model_registry.py)
+        with timed('model.get'):
+            model_lr = get_model(df, 'Logistic Regression')
+
+    if st.button("Make a Prediction! (Attrition: 1 = Employee Leaves | Attrition: 0 = Employee Stays)"):
+        with timed('model.predict'):
+            prediction_lr = predict(model_lr, user_input_lr)
+        st.write(f"{model_lr} predicts the attrition as {prediction_lr[0]}.")
+        st.balloons()
+        if prediction_lr[0] == 0:
+            st.subheader("Attrition 0 = Employee Will Stay!")
+        else:
+            st.subheader("Attrition 1 = Employee Will Leave!")
+    
+    with timed('model.predict_proba'):
+        prediction_proba_lr = predict_proba(model_lr, user_input_lr)
+    st.write(f"The predicted probability of attrition is: {prediction_proba_lr[0]:.2%}")
+
+    # Batch scoring: rank a whole file of employees in one vectorized pass
+    st.subheader("Score Many Employees at Once")
+    st.write("Upload a CSV or Parquet file with the same columns as the sliders above (or score the current workforce) to get every employee's attrition risk, ranked from highest to lowest.")
+    uploaded_file = st.file_uploader("Upload employees:", type=['csv', 'parquet'])
+    score_workforce = st.checkbox("Score the whole current workforce instead")
+    top_n = st.number_input("Only keep the N highest-risk employees (0 = keep everyone):", min_value=0, value=0, step=10)
+    if (uploaded_file is not None or score_workforce) and st.button("Score Employees"):
+        scored = io.BytesIO()
+        if score_workforce:
+            with timed('data.load'):
+                df = load_data()
+        try:
+            with timed('model.batch_score'):
+                n_scored, n_skipped = score_file(df if score_workforce else uploaded_file, scored, model=model_lr,
+                                                 top=top_n or None, out_fmt='csv')
+        except ValueError as err:
+            st.error(str(err))
+        else:
+            # kept only until it is downloaded, so a big result doesn't stay in the session
+            st.session_state['scored_csv'] = scored.getvalue()
+            st.session_state['scored_preview'] = pd.read_csv(io.BytesIO(st.session_state['scored_csv']), nrows=20)
+            st.success(f"Scored {n_scored} employees.")
+            if n_skipped:
+                st.warning(f"{n_skipped} employees have missing values and were left out.")
+    if 'scored_csv' in st.session_state:
+        st.dataframe(st.session_state['scored_preview'])
+        st.download_button("Download Scored Employees", st.session_state['scored_csv'],
+                           file_name="scored_employees.csv", mime="text/csv", on_click=_drop_scored)
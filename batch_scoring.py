@@ -0,0 +1,244 @@
+"""Score many employees at once with the attrition model.
+
+Usage:
+    python batch_scoring.py employees.csv -o scored.csv
+    python batch_scoring.py employees.parquet -o scored.parquet --top 100
+"""
+import argparse
+import os
+import pickle
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_PATH, load_data
+from model_registry import FEATURES, REPO_DIR, get_model, predict_proba
+
+CHUNKSIZE = 100_000
+
+
+def _source_format(source, fmt=None):
+    if fmt:
+        return fmt
+    name = source if isinstance(source, str) else getattr(source, 'name', '')
+    return 'parquet' if str(name).lower().endswith('.parquet') else 'csv'
+
+
+def _rewind(source):
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+
+def read_chunks(source, columns=None, chunksize=CHUNKSIZE, fmt=None):
+    """Yield DataFrame chunks from a DataFrame, CSV or Parquet file (path or file object)."""
+    if isinstance(source, pd.DataFrame):
+        frame = source if columns is None else source[columns]
+        for start in range(0, len(frame), chunksize):
+            yield frame.iloc[start:start + chunksize]
+        return
+    _rewind(source)
+    if _source_format(source, fmt) == 'parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunksize)
+
+
+def check_columns(source, features=FEATURES, fmt=None):
+    """Raise ValueError if ``source`` is missing any of the model's feature columns."""
+    if isinstance(source, pd.DataFrame):
+        columns = source.columns
+    else:
+        _rewind(source)
+        if _source_format(source, fmt) == 'parquet':
+            import pyarrow.parquet as pq
+            columns = pq.ParquetFile(source).schema_arrow.names
+        else:
+            columns = pd.read_csv(source, nrows=0).columns
+    missing = [col for col in features if col not in columns]
+    if missing:
+        raise ValueError(f"Missing columns needed for scoring: {missing}")
+
+
+def score_probabilities(model, source, chunksize=CHUNKSIZE, fmt=None):
+    """One vectorized pass over ``source`` returning the attrition probability of every row.
+
+    Rows with a missing feature can't be scored and get NaN.
+    """
+    parts = []
+    for chunk in read_chunks(source, FEATURES, chunksize, fmt):
+        complete = chunk.notna().all(axis=1).to_numpy()
+        probabilities = np.full(len(chunk), np.nan)
+        if complete.any():
+            probabilities[complete] = predict_proba(model, chunk[complete])
+        parts.append(probabilities)
+    return np.concatenate(parts) if parts else np.empty(0)
+
+
+def risk_ranks(probabilities):
+    """1 = highest attrition risk; ties keep input order and unscored (NaN) rows come last."""
+    order = np.argsort(-probabilities, kind='stable')
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return order, ranks
+
+
+class _ChunkWriter:
+    """Append DataFrame chunks to a CSV or Parquet destination."""
+
+    def __init__(self, dest, fmt):
+        self.fmt = fmt
+        # open paths once so every chunk appends to the same file
+        self._owned = isinstance(dest, str) and fmt != 'parquet'
+        self.dest = open(dest, 'w', newline='') if self._owned else dest
+        self._parquet = None
+        self._first = True
+
+    def write(self, chunk):
+        if self.fmt == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            if self._parquet is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                self._parquet = pq.ParquetWriter(self.dest, table.schema)
+            else:
+                table = pa.Table.from_pandas(chunk, schema=self._parquet.schema, preserve_index=False)
+            self._parquet.write_table(table)
+        else:
+            chunk.to_csv(self.dest, header=self._first, index=False)
+        self._first = False
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._owned:
+            self.dest.close()
+
+
+def _scored_chunks(source, probabilities, ranks, keep, chunksize, fmt):
+    """Re-read ``source`` and yield its ``keep`` rows with the scoring columns added, in input order."""
+    offset = 0
+    for chunk in read_chunks(source, chunksize=chunksize, fmt=fmt):
+        mask = keep[offset:offset + len(chunk)]
+        rows = np.flatnonzero(mask) + offset
+        offset += len(chunk)
+        if len(rows):
+            yield chunk[mask].assign(attrition_probability=probabilities[rows],
+                                     attrition_prediction=(probabilities[rows] > 0.5).astype(np.int8),
+                                     risk_rank=ranks[rows])
+
+
+def _spill(spill_dir, bucket, piece):
+    with open(os.path.join(spill_dir, f"{bucket}.pkl"), 'ab') as spill_file:
+        pickle.dump(piece, spill_file)
+
+
+def _read_spill(spill_dir, bucket):
+    path = os.path.join(spill_dir, f"{bucket}.pkl")
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as spill_file:
+        while True:
+            try:
+                yield pickle.load(spill_file)
+            except EOFError:
+                return
+
+
+def _write_ranked(scored, writer, n_rows, chunksize):
+    """Write ``scored`` chunks riskiest first without holding more than about ``chunksize`` rows.
+
+    Ranks are already known, so rows are bucketed by rank (bucket i holds
+    ranks i*chunksize+1 .. (i+1)*chunksize) into temporary files, and each
+    bucket is then read back, sorted and written in turn.
+    """
+    n_buckets = -(-n_rows // chunksize)
+    if n_buckets <= 1:
+        pieces = list(scored)
+        if pieces:
+            writer.write(pd.concat(pieces).sort_values('risk_rank'))
+        return
+    with tempfile.TemporaryDirectory(prefix='attrition_scores_') as spill_dir:
+        for chunk in scored:
+            chunk = chunk.sort_values('risk_rank')
+            buckets = (chunk['risk_rank'].to_numpy() - 1) // chunksize
+            bounds = np.flatnonzero(np.diff(buckets)) + 1
+            for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(chunk)]):
+                _spill(spill_dir, buckets[start], chunk.iloc[start:end])
+        for bucket in range(n_buckets):
+            pieces = list(_read_spill(spill_dir, bucket))
+            if pieces:
+                writer.write(pd.concat(pieces).sort_values('risk_rank'))
+
+
+def score_file(source, dest, model=None, chunksize=CHUNKSIZE, top=None, fmt=None, out_fmt=None, ranked=True):
+    """Score every row of ``source`` and stream the results to ``dest``, riskiest first.
+
+    The first pass reads only the feature columns and keeps one probability
+    per row; the second pass re-reads the input chunk by chunk and adds
+    ``attrition_probability``, ``attrition_prediction`` and ``risk_rank``
+    columns. Output is sorted by ``risk_rank`` through rank-bucketed
+    temporary files, so memory stays bounded by ``chunksize``; with
+    ``ranked=False`` rows are written in input order instead. With ``top``
+    only the ``top`` riskiest rows are written. Rows with a missing feature
+    are left out. Returns ``(rows written, rows skipped)``.
+    """
+    if model is None:
+        model = get_model(load_data())
+    check_columns(source, fmt=fmt)
+    probabilities = score_probabilities(model, source, chunksize, fmt)
+    _, ranks = risk_ranks(probabilities)
+    keep = ~np.isnan(probabilities)
+    skipped = int((~keep).sum())
+    if top is not None:
+        keep &= ranks <= top
+    n_rows = int(keep.sum())
+    scored = _scored_chunks(source, probabilities, ranks, keep, chunksize, fmt)
+    writer = _ChunkWriter(dest, out_fmt or _source_format(dest))
+    try:
+        if ranked:
+            _write_ranked(scored, writer, n_rows, chunksize)
+        else:
+            for chunk in scored:
+                writer.write(chunk)
+    finally:
+        writer.close()
+    return n_rows, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file of employees for attrition risk.")
+    parser.add_argument('input', help="CSV or Parquet file with the model's feature columns")
+    parser.add_argument('-o', '--output', help="where to write the scored rows (default: stdout as CSV)")
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE, help="rows scored per chunk")
+    parser.add_argument('--top', type=int, help="only write the N highest-risk employees")
+    parser.add_argument('--input-order', action='store_true', help="keep the input row order instead of ranking")
+    parser.add_argument('--data', default=os.path.join(REPO_DIR, DATA_PATH),
+                        help="training data for the model (default: the app's data file)")
+    parser.add_argument('--model', help="pickled model to score with instead of training on --data")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        parser.error(f"{args.input} does not exist")
+    if args.model:
+        with open(args.model, 'rb') as model_file:
+            model = pickle.load(model_file)
+    else:
+        model = get_model(load_data(args.data, use_cache=False))
+    dest = args.output or sys.stdout
+    try:
+        written, skipped = score_file(args.input, dest, model=model, chunksize=args.chunksize, top=args.top,
+                                      ranked=not args.input_order)
+    except ValueError as err:
+        parser.error(str(err))
+    if skipped:
+        print(f"Skipped {skipped} rows with missing feature values", file=sys.stderr)
+    if args.output:
+        print(f"Scored {written} rows -> {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Cold-start benchmark: time to first render and resident memory for each page.
+
+Every page is rendered in a fresh interpreter through Streamlit's AppTest, so
+the numbers include importing that page's modules and loading the data.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 3] [--json startup.json]
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, 'app.py')
+HEAVY_MODULES = ['pandas', 'sklearn', 'plotly', 'matplotlib', 'pyarrow']
+
+
+def _rss_mb():
+    """Current resident set size in MB (Linux), falling back to the peak."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure_page(page, timeout=120):
+    """Render ``page`` once cold and once warm in this process and return the measurements."""
+    os.chdir(REPO_ROOT)
+    sys.path.insert(0, REPO_ROOT)
+    # baseline before streamlit: importing it (and its test harness) already loads some heavy modules
+    before_modules = set(sys.modules)
+    import streamlit  # noqa: F401
+    preloaded = sorted(m for m in HEAVY_MODULES if m in sys.modules)
+    from streamlit.testing.v1 import AppTest
+
+    rss_before = _rss_mb()
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.session_state['page'] = page
+    start = time.perf_counter()
+    at.run()
+    first_render = time.perf_counter() - start
+    rss_after = _rss_mb()
+    start = time.perf_counter()
+    at.run()
+    rerun = time.perf_counter() - start
+    loaded = set(sys.modules) - before_modules
+    return {
+        'page': page,
+        'first_render_ms': first_render * 1000,
+        'rerun_ms': rerun * 1000,
+        'rss_mb': rss_after,
+        'rss_delta_mb': rss_after - rss_before,
+        'modules_loaded': len(loaded),
+        'heavy_modules_loaded': sorted(m for m in HEAVY_MODULES if m in loaded),
+        'heavy_modules_preloaded': preloaded,
+        'errors': [e.message for e in at.exception],
+    }
+
+
+def run_cold(page, timeout=120):
+    """Measure ``page`` in a fresh interpreter so nothing is already imported or cached."""
+    out = subprocess.run([sys.executable, __file__, '--child', page, '--timeout', str(timeout)],
+                         capture_output=True, text=True, cwd=REPO_ROOT, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs):
+    summary = dict(runs[0])
+    for field in ('first_render_ms', 'rerun_ms', 'rss_mb', 'rss_delta_mb'):
+        summary[field] = statistics.median(run[field] for run in runs)
+    summary['errors'] = sorted({err for run in runs for err in run['errors']})
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start time and memory for each page of the app.")
+    parser.add_argument('--runs', type=int, default=3, help="fresh interpreters per page (median is reported)")
+    parser.add_argument('--timeout', type=float, default=120, help="seconds allowed per script run")
+    parser.add_argument('--json', help="also write the results to this file")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_page(args.child, args.timeout)))
+        return
+
+    sys.path.insert(0, REPO_ROOT)
+    from app_pages import PAGES
+
+    results = [summarize([run_cold(page, args.timeout) for _ in range(args.runs)]) for page in PAGES]
+    print(f"{'page':<22}{'first render':>14}{'rerun':>10}{'RSS':>10}{'+RSS':>10}  heavy imports")
+    for r in results:
+        print(f"{r['page']:<22}{r['first_render_ms']:>12.0f}ms{r['rerun_ms']:>8.0f}ms"
+              f"{r['rss_mb']:>8.0f}MB{r['rss_delta_mb']:>8.0f}MB  {', '.join(r['heavy_modules_loaded']) or '-'}")
+        for err in r['errors']:
+            print(f"    error: {err}")
+    if results:
+        print(f"(importing streamlit alone loads: {', '.join(results[0]['heavy_modules_preloaded']) or '-'})")
+    if args.json:
+        with open(args.json, 'w') as out_file:
+            json.dump(results, out_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
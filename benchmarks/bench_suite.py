@@ -0,0 +1,209 @@
+"""Benchmark suite: how each part of the app scales with the number of employees.
+
+For every dataset size this measures data loading, EDA chart build time and
+payload, model fit/predict latency for KNN, Logistic Regression and Random
+Forest, and single-row vs batch prediction throughput. With ``--sessions`` it
+also runs the headless load test (load_test.py) against the same data.
+``--check`` compares the results with benchmarks/budgets.json and exits
+non-zero if any budget is exceeded.
+
+Usage:
+    python benchmarks/bench_suite.py --sizes 1k,100k --check
+    python benchmarks/bench_suite.py --sizes 1m --sessions 16 --json results.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import warnings
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+BUDGETS_PATH = os.path.join(BENCH_DIR, 'budgets.json')
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+from sklearn.exceptions import ConvergenceWarning  # noqa: E402
+from sklearn.model_selection import train_test_split  # noqa: E402
+
+import data_loader  # noqa: E402
+import eda_charts  # noqa: E402
+from batch_scoring import score_probabilities  # noqa: E402
+from instrumentation import rss_mb  # noqa: E402
+from load_test import run_load_test  # noqa: E402
+from model_registry import FEATURES, MODEL_TYPES, TARGET, get_model, predict_proba  # noqa: E402
+from synthetic import DATA_DIR, SIZES, synthetic_path  # noqa: E402
+
+# fitting KNN/Random Forest on 10M rows says nothing useful, so large sets are subsampled
+MAX_FIT_ROWS = 100_000
+MAX_PREDICT_ROWS = 20_000
+SINGLE_PREDICTIONS = 200
+EDA_CHARTS = [
+    ('histogram', ('monthlyincome',), None),
+    ('histogram', ('monthlyincome',), 'attrition'),
+    ('box', ('monthlyincome',), 'attrition'),
+    ('scatter', ('age', 'monthlyincome'), None),
+    ('scatter', ('age', 'monthlyincome'), 'attrition'),
+]
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    value = fn(*args, **kwargs)
+    return value, time.perf_counter() - start
+
+
+def bench_load(path):
+    data_loader.clear_cache(path)
+    _, csv_seconds = _timed(data_loader.load_data, path, use_cache=False)
+    data_loader.clear_cache(path)
+    data_loader.load_data(path)  # builds the parquet cache
+    data_loader._frames.clear()
+    df, cached_seconds = _timed(data_loader.load_data, path)
+    _, hit_seconds = _timed(data_loader.load_data, path)
+    return df, {
+        'csv_mb': os.path.getsize(path) / 2**20,
+        'frame_mb': df.memory_usage(deep=True).sum() / 2**20,
+        'load_csv_s': csv_seconds,
+        'load_cached_s': cached_seconds,
+        'load_hit_ms': hit_seconds * 1000,
+    }
+
+
+def bench_eda(df, version):
+    builders = {'histogram': eda_charts.histogram_figure, 'box': eda_charts.box_figure,
+                'scatter': eda_charts.scatter_figure}
+    results = {}
+    for kind, cols, hue in EDA_CHARTS:
+        eda_charts.clear_aggregates()
+        fig, build_seconds = _timed(builders[kind], df, version, *cols, 'benchmark', hue=hue)
+        payload, serialize_seconds = _timed(fig.to_json)
+        _, cached_seconds = _timed(builders[kind], df, version, *cols, 'benchmark', hue=hue)
+        name = f"{kind}:{'/'.join(cols)}" + (f":{hue}" if hue else '')
+        results[name] = {'build_s': build_seconds, 'cached_build_s': cached_seconds,
+                         'serialize_s': serialize_seconds, 'payload_kb': len(payload) / 1024}
+    return results, {
+        'eda_build_s_max': max(r['build_s'] for r in results.values()),
+        'eda_payload_kb_max': max(r['payload_kb'] for r in results.values()),
+    }
+
+
+def bench_models(df):
+    sample = df.sample(min(len(df), MAX_FIT_ROWS), random_state=0) if len(df) > MAX_FIT_ROWS else df
+    X_train, X_test, y_train, _ = train_test_split(sample[FEATURES], sample[TARGET], random_state=42)
+    X_predict = df[FEATURES].iloc[:MAX_PREDICT_ROWS]
+    one_row = X_test.iloc[[0]]
+    results = {}
+    for model_type, model_class in MODEL_TYPES.items():
+        model = model_class()
+        _, fit_seconds = _timed(model.fit, X_train, y_train)
+        _, batch_seconds = _timed(model.predict_proba, X_predict)
+        single = [_timed(model.predict_proba, one_row)[1] for _ in range(SINGLE_PREDICTIONS)]
+        results[model_type] = {'fit_rows': len(X_train), 'fit_s': fit_seconds,
+                               'predict_rows_per_s': len(X_predict) / batch_seconds,
+                               'predict_single_ms': statistics.median(single) * 1000}
+    return results
+
+
+def bench_throughput(df):
+    """Single-row vs batch scoring with the registry's logistic regression."""
+    model = get_model(df, use_artifact=False)
+    rows = [df[FEATURES].iloc[[i]] for i in range(min(len(df), SINGLE_PREDICTIONS))]
+    _, single_seconds = _timed(lambda: [predict_proba(model, row) for row in rows])
+    _, batch_seconds = _timed(score_probabilities, model, df)
+    return {
+        'predict_single_ms': single_seconds / len(rows) * 1000,
+        'single_rows_per_s': len(rows) / single_seconds,
+        'batch_rows_per_s': len(df) / batch_seconds,
+    }
+
+
+def run_size(size, sessions=0, workers=1):
+    path = synthetic_path(size)
+    df, result = bench_load(path)
+    result['rows'] = len(df)
+    eda_detail, eda_summary = bench_eda(df, data_loader.data_version(path))
+    result.update(eda_summary)
+    models = bench_models(df)
+    for model_type, stats in models.items():
+        result[f"fit_s.{model_type}"] = stats['fit_s']
+        result[f"predict_single_ms.{model_type}"] = stats['predict_single_ms']
+    result.update(bench_throughput(df))
+    result['rss_mb'] = rss_mb()
+    if sessions:
+        load = run_load_test(path, sessions, workers)
+        result['load_test_p50_ms'] = load['p50_ms']
+        result['load_test_p95_ms'] = load['p95_ms']
+        for step, stats in load['steps'].items():
+            result[f"load_test_p50_ms.{step}"] = stats['p50_ms']
+            result[f"load_test_p95_ms.{step}"] = stats['p95_ms']
+        result['load_test_rss_mb'] = load['worker_rss_mb_max']
+        result['load_test_rss_peak_mb'] = load['worker_rss_peak_mb']
+        result['load_test_errors'] = len(load['errors'])
+    data_loader.clear_cache(path)
+    return {'summary': result, 'eda': eda_detail, 'models': models}
+
+
+def check_budgets(results, budgets):
+    """List of human-readable budget violations (empty if everything is within budget)."""
+    violations = []
+    for size, result in results.items():
+        for metric, limit in budgets.get(size, {}).items():
+            value = result['summary'].get(metric)
+            if value is None:
+                continue
+            # throughput budgets are minimums, everything else is a maximum
+            too_slow = value < limit if metric.endswith('_per_s') else value > limit
+            if too_slow:
+                violations.append(f"{size} {metric}: {value:.4g} (budget {limit})")
+    return violations
+
+
+def print_results(results):
+    for size, result in results.items():
+        print(f"== {size} ({result['summary']['rows']:,} rows)")
+        for metric, value in result['summary'].items():
+            print(f"  {metric:<40}{value:>14.4g}" if isinstance(value, float) else f"  {metric:<40}{value:>14}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the attrition app at several dataset sizes.")
+    parser.add_argument('--sizes', default='1k,100k', help=f"comma-separated sizes from {', '.join(SIZES)}")
+    parser.add_argument('--sessions', type=int, default=0, help="also run the load test with this many sessions")
+    parser.add_argument('--workers', type=int, default=1, help="load test server processes")
+    parser.add_argument('--json', help="write the full results to this file")
+    parser.add_argument('--check', action='store_true', help="fail if any budget in budgets.json is exceeded")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(',') if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {unknown}")
+    # keep parquet caches of the synthetic data out of the repo's data/.cache
+    data_loader.CACHE_DIR = os.path.join(DATA_DIR, 'cache')
+    # the app's default LogisticRegression never converges on unscaled data; that's expected here
+    warnings.filterwarnings('ignore', category=ConvergenceWarning)
+
+    results = {size: run_size(size, args.sessions, args.workers) for size in sizes}
+    print_results(results)
+    if args.json:
+        with open(args.json, 'w') as out_file:
+            json.dump(results, out_file, indent=2)
+    if args.check:
+        with open(BUDGETS_PATH) as budgets_file:
+            budgets = json.load(budgets_file)
+        for size in results:
+            if size not in budgets:
+                print(f"No budgets for {size} yet (not measured); nothing checked for it.")
+        violations = check_budgets(results, budgets)
+        for violation in violations:
+            print(f"OVER BUDGET: {violation}")
+        if violations:
+            sys.exit(1)
+        print("All budgets met.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+"""Headless load test: many simulated sessions clicking through every page of the app.
+
+Sessions are driven with Streamlit's AppTest, each on its own thread inside a
+worker process, so they run concurrently against that process's shared data,
+model and chart caches and their locks, as sessions do in a real Streamlit
+server process. ``--workers`` > 1 starts several such processes, like
+several server replicas.
+
+Overlapping AppTest runs on threads rely on a Streamlit internal (the
+``Runtime._instance`` slot, see ``_allow_overlapping_runs``), so the load
+test only runs on the Streamlit version pinned in requirements.txt
+(``TESTED_STREAMLIT_VERSION``) and stops with an error on any other.
+
+Usage:
+    python benchmarks/load_test.py --size 100k --sessions 16
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, 'app.py')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import SIZES, synthetic_path  # noqa: E402
+
+# the Streamlit release whose Runtime internals _allow_overlapping_runs was written against (see requirements.txt)
+TESTED_STREAMLIT_VERSION = '1.29.0'
+
+
+def _widget(elements, label):
+    return next(element for element in elements if element.label == label)
+
+
+def _goto(page):
+    def step(at):
+        at.sidebar.selectbox[0].select(page)
+    return step
+
+
+def _eda_histogram(at):
+    _goto("📈 EDA")(at)
+    at.run()
+    at.multiselect[0].set_value(["Histogram"])
+    at.run()
+    _widget(at.selectbox, "Select a numerical column for your Histogram:").select('monthlyincome')
+
+
+def _modeling_lr(at):
+    _goto("⚙️ Modeling")(at)
+    at.run()
+    _widget(at.selectbox, "Select a Model:").select('Logistic Regression')
+    at.run()
+    _widget(at.button, "Let's see the performance!").click()
+
+
+def _predictions_slider(at):
+    _widget(at.slider, "Age").set_value(45)
+
+
+# (name, interaction before the timed run); the first step is the initial page load
+SCENARIO = [
+    ('home', None),
+    ('data_overview', _goto("📂 Data Overview")),
+    ('eda_histogram', _eda_histogram),
+    ('modeling_lr', _modeling_lr),
+    ('predictions', _goto("🔮 Make Predictions!")),
+    ('predictions_slider', _predictions_slider),
+]
+
+
+def make_workdir(csv_path):
+    """A scratch copy of the app's working directory whose data file is ``csv_path``.
+
+    The app reads data/final_attrition_df.csv relative to the working directory,
+    so this lets it run on synthetic data without touching the real data. The
+    committed model artifact is found from the repo and, being for other data,
+    is simply not used.
+    """
+    workdir = tempfile.mkdtemp(prefix='attrition_load_')
+    os.makedirs(os.path.join(workdir, 'data'))
+    os.symlink(os.path.abspath(csv_path), os.path.join(workdir, 'data', 'final_attrition_df.csv'))
+    for name in ('images', 'audio'):
+        os.symlink(os.path.join(REPO_ROOT, name), os.path.join(workdir, name))
+    return workdir
+
+
+def check_streamlit():
+    """Raise RuntimeError unless the installed Streamlit is the one the thread patch was tested on."""
+    import streamlit
+    from streamlit.runtime.runtime import Runtime
+
+    if streamlit.__version__ != TESTED_STREAMLIT_VERSION or not hasattr(Runtime, '_instance'):
+        raise RuntimeError(
+            f"the load test runs sessions on threads by patching Streamlit {TESTED_STREAMLIT_VERSION} internals, "
+            f"but Streamlit {streamlit.__version__} is installed; install the version pinned in requirements.txt "
+            f"and check _allow_overlapping_runs against it before raising TESTED_STREAMLIT_VERSION")
+
+
+def _allow_overlapping_runs():
+    """Let AppTest runs overlap on threads.
+
+    AppTest installs a mock Runtime in a process-wide slot for each run and
+    clears it when the run ends, so a run finishing on one thread breaks the
+    runs still going on the others. Keep the most recent mock available.
+    """
+    from streamlit.runtime.runtime import Runtime
+
+    check_streamlit()
+
+    last = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            last[:] = [cls._instance]
+            return cls._instance
+        if last:
+            return last[0]
+        raise RuntimeError("Runtime hasn't been created!")
+
+    Runtime.instance = classmethod(instance)
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB.
+
+    Read from /proc on Linux: ru_maxrss survives fork+exec there, so it would
+    report the parent's peak when the worker was started from a big process.
+    """
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_session(at, iterations, latencies, errors):
+    for _ in range(iterations):
+        for name, interact in SCENARIO:
+            if interact is not None:
+                interact(at)
+            start = time.perf_counter()
+            at.run()
+            latencies[name].append(time.perf_counter() - start)
+            errors.extend(f"{name}: {e.message}" for e in at.exception)
+        _goto("🏠 Home")(at)
+
+
+def run_worker(workdir, n_sessions, iterations, timeout):
+    """Drive ``n_sessions`` concurrent sessions, one thread each, and return their latencies."""
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    from instrumentation import rss_mb
+
+    _allow_overlapping_runs()
+    latencies = {name: [] for name, _ in SCENARIO}
+    errors = []
+    threads = [threading.Thread(target=_run_session, args=(AppTest.from_file(APP_PATH, default_timeout=timeout),
+                                                          iterations, latencies, errors))
+               for _ in range(n_sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {'latencies': latencies, 'rss_mb': rss_mb(),
+            'rss_peak_mb': _peak_rss_mb(), 'errors': errors}
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def summarize(worker_results, wall_seconds):
+    steps = {}
+    all_latencies = []
+    for name, _ in SCENARIO:
+        values = [v for result in worker_results for v in result['latencies'][name]]
+        all_latencies.extend(values)
+        steps[name] = {'runs': len(values), 'p50_ms': statistics.median(values) * 1000,
+                       'p95_ms': _percentile(values, 95) * 1000, 'max_ms': max(values) * 1000}
+    return {
+        'steps': steps,
+        'runs': len(all_latencies),
+        'p50_ms': statistics.median(all_latencies) * 1000,
+        'p95_ms': _percentile(all_latencies, 95) * 1000,
+        'runs_per_s': len(all_latencies) / wall_seconds,
+        'worker_rss_mb_max': max(result['rss_mb'] for result in worker_results),
+        'worker_rss_peak_mb': max(result['rss_peak_mb'] for result in worker_results),
+        'errors': sorted({err for result in worker_results for err in result['errors']}),
+    }
+
+
+def run_load_test(csv_path, sessions=8, workers=1, iterations=1, timeout=300):
+    """Run ``sessions`` simulated sessions over ``workers`` processes against ``csv_path``."""
+    check_streamlit()
+    workdir = make_workdir(csv_path)
+    try:
+        per_worker = [sessions // workers + (i < sessions % workers) for i in range(workers)]
+        start = time.perf_counter()
+        procs = [subprocess.Popen([sys.executable, __file__, '--worker', workdir, '--sessions', str(n),
+                                   '--iterations', str(iterations), '--timeout', str(timeout)],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+                 for n in per_worker if n]
+        results = []
+        for proc in procs:
+            out, _ = proc.communicate()
+            if proc.returncode != 0:
+                raise RuntimeError(f"load test worker failed with exit code {proc.returncode}")
+            results.append(json.loads(out.strip().splitlines()[-1]))
+        return summarize(results, time.perf_counter() - start)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def print_summary(summary):
+    print(f"{'step':<22}{'runs':>6}{'p50':>10}{'p95':>10}{'max':>10}")
+    for name, step in summary['steps'].items():
+        print(f"{name:<22}{step['runs']:>6}{step['p50_ms']:>8.0f}ms{step['p95_ms']:>8.0f}ms{step['max_ms']:>8.0f}ms")
+    print(f"overall: {summary['runs']} runs, p50 {summary['p50_ms']:.0f}ms, p95 {summary['p95_ms']:.0f}ms, "
+          f"{summary['runs_per_s']:.1f} runs/s, worker RSS {summary['worker_rss_mb_max']:.0f}MB at the end, "
+          f"{summary['worker_rss_peak_mb']:.0f}MB peak")
+    for err in summary['errors']:
+        print(f"    error: {err}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent sessions against the attrition app.")
+    parser.add_argument('--size', default='1k', choices=list(SIZES) + ['real'],
+                        help="synthetic dataset size, or 'real' for data/final_attrition_df.csv")
+    parser.add_argument('--sessions', type=int, default=8, help="simulated sessions in total")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="server processes the sessions are spread over (each runs its sessions on threads)")
+    parser.add_argument('--iterations', type=int, default=1, help="times each session walks the scenario")
+    parser.add_argument('--timeout', type=float, default=300, help="seconds allowed per script run")
+    parser.add_argument('--json', help="also write the summary to this file")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.sessions, args.iterations, args.timeout)))
+        return
+
+    csv_path = os.path.join(REPO_ROOT, 'data', 'final_attrition_df.csv') if args.size == 'real' \
+        else synthetic_path(args.size)
+    summary = run_load_test(csv_path, args.sessions, args.workers, args.iterations, args.timeout)
+    print_summary(summary)
+    if args.json:
+        with open(args.json, 'w') as out_file:
+            json.dump(summary, out_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Synthetic employee datasets with the same schema as data/final_attrition_df.csv.
+
+Rows are resampled from the real data (so columns keep their joint
+distribution), with numeric columns jittered so large datasets are not just
+copies of 1,470 employees. Files are written in chunks, so 10M rows never sit
+in memory at once.
+
+Usage:
+    python benchmarks/synthetic.py 1000000 -o benchmarks/.data/attrition_1m.csv
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_PATH = os.path.join(REPO_ROOT, 'data', 'final_attrition_df.csv')
+DATA_DIR = os.path.join(REPO_ROOT, 'benchmarks', '.data')
+SIZES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000, '10m': 10_000_000}
+CHUNKSIZE = 500_000
+# columns that get noise added; everything else is copied from the sampled row
+JITTER = {'age': 2, 'dailyrate': 50, 'distancefromhome': 2, 'hourlyrate': 5, 'monthlyincome': 300,
+          'monthlyrate': 500, 'totalworkingyears': 1}
+
+
+def synthetic_chunks(n_rows, seed=0, chunksize=CHUNKSIZE):
+    """Yield DataFrames totalling ``n_rows`` rows of synthetic employees."""
+    source = pd.read_csv(SOURCE_PATH)
+    index_col = source.columns[0]
+    rng = np.random.default_rng(seed)
+    lows, highs = source.min(numeric_only=True), source.max(numeric_only=True)
+    for start in range(0, n_rows, chunksize):
+        size = min(chunksize, n_rows - start)
+        chunk = source.iloc[rng.integers(len(source), size=size)].reset_index(drop=True)
+        for col, scale in JITTER.items():
+            noise = rng.integers(-scale, scale + 1, size=size)
+            chunk[col] = np.clip(chunk[col] + noise, lows[col], highs[col]).astype(chunk[col].dtype)
+        chunk[index_col] = np.arange(start, start + size)
+        chunk['employeenumber'] = np.arange(start + 1, start + size + 1)
+        yield chunk
+
+
+def write_synthetic(path, n_rows, seed=0):
+    """Write ``n_rows`` synthetic employees to ``path`` (CSV or .parquet) and return the path."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    if path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        for chunk in synthetic_chunks(n_rows, seed):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            writer = writer or pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+        writer.close()
+    else:
+        with open(tmp_path, 'w', newline='') as out_file:
+            for i, chunk in enumerate(synthetic_chunks(n_rows, seed)):
+                chunk.to_csv(out_file, header=i == 0, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def synthetic_path(size, ext='csv'):
+    """Path of the synthetic dataset for ``size`` (e.g. '100k'), generating it on first use."""
+    path = os.path.join(DATA_DIR, f"attrition_{size}.{ext}")
+    if not os.path.exists(path):
+        write_synthetic(path, SIZES[size])
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic employee attrition dataset.")
+    parser.add_argument('rows', type=int, help="number of employees")
+    parser.add_argument('-o', '--output', required=True, help="CSV or .parquet file to write")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    write_synthetic(args.output, args.rows, args.seed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import gzip
+import io
+import threading
+from collections import OrderedDict
+
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+    'Parquet': ('parquet', 'application/octet-stream'),
+}
+CHUNKSIZE = 50_000
+# exports are large, so the cache is capped by total size; bigger exports are never cached
+MAX_CACHED_BYTES = 256 * 2**20
+
+_exports = OrderedDict()
+_cached_bytes = 0
+_lock = threading.Lock()
+
+
+def filter_frame(df, columns=None, filters=None):
+    """Subset ``df`` to ``columns`` and to rows whose values are in ``filters[col]``."""
+    if filters:
+        mask = None
+        for col, allowed in filters.items():
+            col_mask = df[col].isin(list(allowed))
+            mask = col_mask if mask is None else mask & col_mask
+        df = df[mask]
+    if columns:
+        df = df[list(columns)]
+    return df
+
+
+def _write_csv(df, out, chunksize):
+    # one chunk of text is alive at a time instead of the whole file as a str
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start:start + chunksize]
+        out.write(chunk.to_csv(index=False, header=start == 0).encode())
+    if len(df) == 0:
+        out.write(df.to_csv(index=False).encode())
+
+
+def to_bytes(df, fmt='CSV', chunksize=CHUNKSIZE):
+    """Serialize ``df`` in one of the ``EXPORT_FORMATS``."""
+    buffer = io.BytesIO()
+    if fmt == 'CSV':
+        _write_csv(df, buffer, chunksize)
+    elif fmt == 'CSV (gzip)':
+        with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=6) as gz_file:
+            _write_csv(df, gz_file, chunksize)
+    elif fmt == 'Parquet':
+        df.to_parquet(buffer, index=False)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+    # CPython hands over the BytesIO's own buffer here (trimmed in place) rather than copying it
+    return buffer.getvalue()
+
+
+def export_bytes(df, version, fmt='CSV', columns=None, filters=None):
+    """Bytes of a (filtered) export of ``df``, cached per dataset version and options.
+
+    ``version`` must change whenever ``df`` does (see data_loader.data_version),
+    since the cache does not look at the frame itself.
+    """
+    global _cached_bytes
+    key = (version, fmt, tuple(columns or ()),
+           tuple(sorted((col, tuple(sorted(allowed))) for col, allowed in (filters or {}).items())))
+    with _lock:
+        if key in _exports:
+            _exports.move_to_end(key)
+            return _exports[key]
+    data = to_bytes(filter_frame(df, columns, filters), fmt)
+    if len(data) > MAX_CACHED_BYTES:
+        return data
+    with _lock:
+        if key not in _exports:
+            _exports[key] = data
+            _cached_bytes += len(data)
+        while _cached_bytes > MAX_CACHED_BYTES:
+            _, evicted = _exports.popitem(last=False)
+            _cached_bytes -= len(evicted)
+    return data
+
+
+def export_file_name(base, fmt):
+    return f"{base}.{EXPORT_FORMATS[fmt][0]}"
+
+
+def export_mime(fmt):
+    return EXPORT_FORMATS[fmt][1]
+
+
+def clear_exports():
+    global _cached_bytes
+    with _lock:
+        _exports.clear()
+        _cached_bytes = 0
@@ -0,0 +1,121 @@
+import os
+import threading
+
+import pandas as pd
+
+from instrumentation import timed
+
+try:
+    import pyarrow  # noqa: F401 -- only needed for the parquet cache
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DATA_PATH = 'data/final_attrition_df.csv'
+CACHE_DIR = 'data/.cache'
+
+# one copy of each dataset per process, shared by every streamlit session
+_frames = {}
+_lock = threading.Lock()
+
+
+def _file_key(path):
+    """Identify a version of a file by its absolute path, mtime and size."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def data_version(path=DATA_PATH):
+    """Short string that changes whenever the CSV on disk changes."""
+    _, mtime_ns, size = _file_key(path)
+    return f"{mtime_ns}-{size}"
+
+
+def _cache_path(path, version):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, f"{stem}-{version}.parquet")
+
+
+def _stale_cache_files(path):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if not os.path.isdir(CACHE_DIR):
+        return []
+    return [os.path.join(CACHE_DIR, name) for name in os.listdir(CACHE_DIR)
+            if name.startswith(f"{stem}-") and name.endswith('.parquet')]
+
+
+def compact_dtypes(df):
+    """Shrink a frame in place: object columns become categoricals, integers are downcast."""
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].astype('category')
+        elif pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def _read_csv(path):
+    return compact_dtypes(pd.read_csv(path))
+
+
+def _write_cache(df, cache_file, path):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for old in _stale_cache_files(path):
+        os.remove(old)
+    # write to a temp file first so another process never reads half a file
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, cache_file)
+
+
+def load_data(path=DATA_PATH, use_cache=True):
+    """Return the attrition dataset, parsing the CSV at most once per file version.
+
+    The frame is shared across sessions, so callers must not modify it in place.
+    With ``use_cache`` and pyarrow installed, the parsed frame is also written to a
+    parquet file under ``data/.cache`` so new processes skip the CSV parse.
+    """
+    key = _file_key(path)
+    df = _frames.get(key)
+    if df is not None:
+        return df
+    with _lock:
+        df = _frames.get(key)
+        if df is not None:
+            return df
+        version = f"{key[1]}-{key[2]}"
+        cache_file = _cache_path(path, version)
+        if use_cache and HAS_PYARROW and os.path.exists(cache_file):
+            with timed('data.read_parquet_cache'):
+                df = pd.read_parquet(cache_file, memory_map=True)
+        else:
+            with timed('data.parse_csv'):
+                df = _read_csv(path)
+            if use_cache and HAS_PYARROW:
+                try:
+                    _write_cache(df, cache_file, path)
+                except OSError:
+                    # a read-only checkout still works, just without the parquet cache
+                    pass
+        # drop older versions of the same file so memory doesn't grow with edits
+        for old_key in [k for k in _frames if k[0] == key[0]]:
+            del _frames[old_key]
+        _frames[key] = df
+    return df
+
+
+def clear_cache(path=None):
+    """Forget cached frames and parquet files for ``path`` (or for everything)."""
+    with _lock:
+        if path is None:
+            _frames.clear()
+            if os.path.isdir(CACHE_DIR):
+                for name in os.listdir(CACHE_DIR):
+                    if name.endswith('.parquet'):
+                        os.remove(os.path.join(CACHE_DIR, name))
+            return
+        target = os.path.abspath(path)
+        for old_key in [k for k in _frames if k[0] == target]:
+            del _frames[old_key]
+        for old in _stale_cache_files(path):
+            os.remove(old)
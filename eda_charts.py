@@ -0,0 +1,183 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Set a custom color palette with browns and tans
+CUSTOM_PALETTE = ['#8C564B', '#D2B48C']
+HIST_BINS = 50
+# integer columns with at most this many distinct values get one bar per value
+MAX_UNIT_BINS = 100
+MAX_SCATTER_POINTS = 5000
+MAX_BOX_OUTLIERS = 500
+DENSITY_BINS = 60
+MAX_CACHED_AGGREGATES = 64
+
+# summaries are tiny, so they're shared by every session and keyed on the data version
+_aggregates = OrderedDict()
+_lock = threading.Lock()
+
+
+def _cached(key, build):
+    with _lock:
+        if key in _aggregates:
+            _aggregates.move_to_end(key)
+            return _aggregates[key]
+    value = build()
+    with _lock:
+        _aggregates[key] = value
+        while len(_aggregates) > MAX_CACHED_AGGREGATES:
+            _aggregates.popitem(last=False)
+    return value
+
+
+def clear_aggregates():
+    with _lock:
+        _aggregates.clear()
+
+
+def _groups(df, hue):
+    """(label, row mask) pairs, in order of first appearance like plotly express."""
+    if hue is None:
+        return [(None, np.ones(len(df), dtype=bool))]
+    values = df[hue].to_numpy()
+    return [(label, values == label) for label in pd.unique(values) if not pd.isna(label)]
+
+
+def _bin_edges(values, bins):
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.array([0.0, 1.0])
+    low, high = values.min(), values.max()
+    if np.all(values == np.round(values)) and high - low < MAX_UNIT_BINS:
+        return np.arange(low, high + 2) - 0.5
+    return np.histogram_bin_edges(values, bins=bins, range=(low, high))
+
+
+def histogram_data(df, col, hue=None, bins=HIST_BINS):
+    """Bin counts of ``col`` (per ``hue`` group) as a small long-format frame."""
+    values = df[col].to_numpy(dtype=float)
+    edges = _bin_edges(values, bins)
+    parts = []
+    for label, mask in _groups(df, hue):
+        counts, _ = np.histogram(values[mask], bins=edges)
+        part = pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts})
+        if hue is not None:
+            part[hue] = str(label)
+        parts.append(part)
+    agg = pd.concat(parts, ignore_index=True)
+    agg[col] = (agg['bin_start'] + agg['bin_end']) / 2
+    return agg
+
+
+def box_data(df, col, hue=None):
+    """Quartiles, whisker fences and a capped sample of outliers of ``col`` per ``hue`` group."""
+    values = df[col].to_numpy(dtype=float)
+    rows = []
+    for label, mask in _groups(df, hue):
+        group = values[mask]
+        group = np.sort(group[~np.isnan(group)])
+        if len(group) == 0:
+            continue
+        q1, median, q3 = np.quantile(group, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = group[(group >= q1 - 1.5 * iqr) & (group <= q3 + 1.5 * iqr)]
+        outliers = group[(group < q1 - 1.5 * iqr) | (group > q3 + 1.5 * iqr)]
+        if len(outliers) > MAX_BOX_OUTLIERS:
+            # evenly spaced through the sorted outliers, so the extremes are kept
+            outliers = outliers[np.linspace(0, len(outliers) - 1, MAX_BOX_OUTLIERS).astype(int)]
+        rows.append({'group': 'all' if label is None else str(label), 'q1': q1, 'median': median, 'q3': q3,
+                     'lowerfence': inside.min(), 'upperfence': inside.max(), 'mean': group.mean(),
+                     'count': len(group), 'outliers': outliers})
+    return pd.DataFrame(rows)
+
+
+def scatter_sample(df, x, y, hue=None, max_points=MAX_SCATTER_POINTS, seed=42):
+    """At most ``max_points`` rows of ``x``/``y``, sampled within each ``hue`` group.
+
+    Each group keeps its share of the sample but never fewer than a handful of
+    points, so a rare class (like attrition = 1) stays visible.
+    """
+    cols = list(dict.fromkeys([x, y] + ([hue] if hue else [])))
+    frame = df[cols]
+    if len(frame) <= max_points:
+        return frame.assign(**{hue: frame[hue].astype(str)}) if hue else frame
+    rng = np.random.default_rng(seed)
+    groups = _groups(frame, hue)
+    floor = max_points // (4 * len(groups))
+    picked = []
+    for _, mask in groups:
+        index = np.flatnonzero(mask)
+        n = min(len(index), max(floor, round(max_points * len(index) / len(frame))))
+        picked.append(rng.choice(index, size=n, replace=False))
+    sample = frame.iloc[np.sort(np.concatenate(picked))]
+    return sample.assign(**{hue: sample[hue].astype(str)}) if hue else sample
+
+
+def density_data(df, x, y, hue=None, bins=DENSITY_BINS):
+    """2D bin counts of ``x`` vs ``y`` per ``hue`` group: (x centers, y centers, {group: counts})."""
+    x_values = df[x].to_numpy(dtype=float)
+    y_values = df[y].to_numpy(dtype=float)
+    ok = ~(np.isnan(x_values) | np.isnan(y_values))
+    x_edges = np.histogram_bin_edges(x_values[ok], bins=bins)
+    y_edges = np.histogram_bin_edges(y_values[ok], bins=bins)
+    counts = {}
+    for label, mask in _groups(df, hue):
+        keep = mask & ok
+        counts['all' if label is None else str(label)] = \
+            np.histogram2d(x_values[keep], y_values[keep], bins=[x_edges, y_edges])[0]
+    return (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2, counts
+
+
+def histogram_figure(df, version, col, title, hue=None):
+    agg = _cached((version, 'histogram', col, hue), lambda: histogram_data(df, col, hue))
+    fig = px.bar(agg, x=col, y='count', color=hue, title=title, barmode='overlay',
+                 color_discrete_sequence=CUSTOM_PALETTE)
+    fig.update_traces(width=(agg['bin_end'] - agg['bin_start']).iloc[0], marker_line_width=0)
+    if hue is not None:
+        fig.update_traces(opacity=0.75)
+    fig.update_layout(bargap=0, yaxis_title='count')
+    return fig
+
+
+def box_figure(df, version, col, title, hue=None):
+    stats = _cached((version, 'box', col, hue), lambda: box_data(df, col, hue))
+    fig = go.Figure()
+    for i, row in stats.iterrows():
+        color = CUSTOM_PALETTE[i % len(CUSTOM_PALETTE)]
+        name = row['group'] if hue else col
+        fig.add_trace(go.Box(name=name, y=[name], q1=[row['q1']], median=[row['median']], q3=[row['q3']],
+                             lowerfence=[row['lowerfence']], upperfence=[row['upperfence']], mean=[row['mean']],
+                             orientation='h', marker_color=color, legendgroup=name, showlegend=hue is not None))
+        if len(row['outliers']):
+            fig.add_trace(go.Scatter(x=row['outliers'], y=[name] * len(row['outliers']), mode='markers',
+                                     marker_color=color, legendgroup=name, showlegend=False))
+    fig.update_layout(title=title, xaxis_title=col, yaxis_title=hue, legend_title=hue)
+    return fig
+
+
+def scatter_figure(df, version, x, y, title, hue=None, density=False):
+    if density:
+        x_centers, y_centers, counts = _cached((version, 'density', x, y, hue),
+                                               lambda: density_data(df, x, y, hue))
+        fig = go.Figure()
+        if hue is None:
+            fig.add_trace(go.Heatmap(x=x_centers, y=y_centers, z=counts['all'].T, colorscale='YlOrBr',
+                                     colorbar_title='count'))
+        else:
+            for i, (label, z) in enumerate(counts.items()):
+                color = CUSTOM_PALETTE[i % len(CUSTOM_PALETTE)]
+                fig.add_trace(go.Contour(x=x_centers, y=y_centers, z=z.T, name=f"{hue}={label}",
+                                         contours_coloring='lines', colorscale=[[0, color], [1, color]],
+                                         showscale=False, showlegend=True))
+        fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+        return fig
+    sample = _cached((version, 'scatter', x, y, hue), lambda: scatter_sample(df, x, y, hue))
+    fig = px.scatter(sample, x=x, y=y, title=title, color=hue, color_discrete_sequence=CUSTOM_PALETTE)
+    if len(sample) < len(df):
+        fig.add_annotation(text=f"Showing a {len(sample):,}-point sample of {len(df):,} rows",
+                           xref='paper', yref='paper', x=0, y=1.06, showarrow=False)
+    return fig
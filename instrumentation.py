@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# ATTRITION_PERF=1 turns on the hidden Performance page and chart payload sizing
+# (which costs an extra JSON serialization per chart). Timers are always on.
+ENABLED = os.environ.get('ATTRITION_PERF', '') not in ('', '0')
+# ATTRITION_PERF_LOG=<path> appends one JSON line per measurement to that file
+LOG_PATH = os.environ.get('ATTRITION_PERF_LOG')
+
+PROCESS = '*'
+MAX_SESSIONS = 1000
+MAX_SAMPLES = 512
+
+logger = logging.getLogger('attrition.perf')
+
+_stats = {PROCESS: {}}
+_sessions = OrderedDict()
+_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+
+class StageStats:
+    """Running totals for one stage, plus recent samples for percentiles."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.rss_delta_max = 0.0
+        self.bytes_total = 0
+        self.bytes_last = 0
+        self.samples = deque(maxlen=MAX_SAMPLES)
+
+    def add(self, seconds, rss_delta, nbytes):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+        self.rss_delta_max = max(self.rss_delta_max, rss_delta)
+        if nbytes is not None:
+            self.bytes_total += nbytes
+            self.bytes_last = nbytes
+        self.samples.append(seconds)
+
+    def row(self, stage):
+        samples = np.array(self.samples)
+        return {
+            'stage': stage,
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000,
+            'p50_ms': float(np.percentile(samples, 50)) * 1000,
+            'p95_ms': float(np.percentile(samples, 95)) * 1000,
+            'max_ms': self.max * 1000,
+            'last_ms': self.last * 1000,
+            'total_s': self.total,
+            'rss_delta_max_mb': self.rss_delta_max,
+            'payload_last_kb': self.bytes_last / 1024,
+            'payload_total_mb': self.bytes_total / 2**20,
+        }
+
+
+def rss_mb():
+    """Resident set size of this process in MB (0 where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        return 0.0
+
+
+def session_id():
+    """The current Streamlit session, or None outside a script run (CLI, benchmarks)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def record(stage, seconds, rss_delta=0.0, nbytes=None):
+    """Add one measurement of ``stage`` to the process-wide and per-session aggregates."""
+    session = session_id()
+    with _lock:
+        tables = [_stats[PROCESS]]
+        if session is not None:
+            if session not in _sessions:
+                _sessions[session] = {}
+                while len(_sessions) > MAX_SESSIONS:
+                    _sessions.popitem(last=False)
+            _sessions.move_to_end(session)
+            tables.append(_sessions[session])
+        for table in tables:
+            table.setdefault(stage, StageStats()).add(seconds, rss_delta, nbytes)
+    if LOG_PATH:
+        entry = {'ts': time.time(), 'stage': stage, 'ms': seconds * 1000, 'rss_delta_mb': rss_delta,
+                 'bytes': nbytes, 'session': session, 'pid': os.getpid()}
+        with _log_lock, open(LOG_PATH, 'a') as log_file:
+            log_file.write(json.dumps(entry) + '\n')
+    logger.debug("%s %.1fms", stage, seconds * 1000)
+
+
+@contextmanager
+def timed(stage):
+    """Time the block and record it (with the change in RSS) under ``stage``."""
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start, rss_mb() - rss_before)
+
+
+def plotly_chart(fig, stage):
+    """``st.plotly_chart`` that records render time and, when enabled, the JSON payload size."""
+    import streamlit as st
+
+    nbytes = len(fig.to_json()) if ENABLED else None
+    start = time.perf_counter()
+    st.plotly_chart(fig)
+    record(stage, time.perf_counter() - start, nbytes=nbytes)
+
+
+def snapshot(session=PROCESS):
+    """Aggregates for one session (or the whole process) as a list of dicts, slowest total first."""
+    with _lock:
+        table = _stats[PROCESS] if session == PROCESS else _sessions.get(session, {})
+        rows = [stats.row(stage) for stage, stats in table.items()]
+    return sorted(rows, key=lambda row: row['total_s'], reverse=True)
+
+
+def export_json(session=PROCESS):
+    return json.dumps({'pid': os.getpid(), 'exported_at': time.time(), 'rss_mb': rss_mb(),
+                       'sessions': len(_sessions), 'stages': snapshot(session)}, indent=2)
+
+
+def reset():
+    with _lock:
+        _stats[PROCESS].clear()
+        _sessions.clear()
@@ -0,0 +1,249 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.metrics import accuracy_score, confusion_matrix
+from sklearn.model_selection import StratifiedKFold, train_test_split
+
+from model_registry import FEATURES, MODEL_TYPES, TARGET, data_hash
+
+CV_FOLDS = 5
+RANDOM_STATE = 42
+KNN_K_VALUES = list(range(1, 30, 2))
+
+# evaluation metrics shared by every session, keyed on model/params/data; only the
+# current data version is kept, and never the fitted models (KNN keeps a copy of its data)
+_results = {}
+# the most recently requested downloadable estimator; one entry, so at most one model is kept
+_kept = {}
+# work in progress by key, so identical requests wait for one run and different ones don't wait at all
+_inflight = {}
+_lock = threading.Lock()
+
+
+def _splits(y, cv):
+    """The page's usual train/test split (fold None) and ``cv`` stratified folds, as index arrays."""
+    splits = {None: train_test_split(np.arange(len(y)), random_state=RANDOM_STATE)}
+    folds = StratifiedKFold(n_splits=cv, shuffle=True, random_state=RANDOM_STATE)
+    splits.update(enumerate(folds.split(np.zeros(len(y)), y)))
+    return splits
+
+
+def _new_model(model_type, params):
+    """Estimator for ``params``, seeded so a refit reproduces the model behind the reported metrics."""
+    model = MODEL_TYPES[model_type](**params)
+    if 'random_state' in model.get_params() and 'random_state' not in params:
+        model.set_params(random_state=RANDOM_STATE)
+    return model
+
+
+def _fit(model_type, params, X, y, features, train):
+    model = _new_model(model_type, params)
+    return model.fit(pd.DataFrame(X[train], columns=features), y[train])
+
+
+def _run_task(model_type, params, X, y, features, train, test, holdout, keep_model=False):
+    """Fit one model on one split and return its metrics (and the model if ``keep_model``)."""
+    start = time.perf_counter()
+    model = _fit(model_type, params, X, y, features, train)
+    fit_seconds = time.perf_counter() - start
+    X_test = pd.DataFrame(X[test], columns=features)
+    start = time.perf_counter()
+    test_pred = model.predict(X_test)
+    predict_seconds = time.perf_counter() - start
+    result = {'test_accuracy': accuracy_score(y[test], test_pred),
+              'fit_seconds': fit_seconds, 'predict_seconds': predict_seconds}
+    if holdout:
+        result['train_accuracy'] = model.score(pd.DataFrame(X[train], columns=features), y[train])
+        result['confusion_matrix'] = confusion_matrix(y[test], test_pred, labels=[0, 1])
+    if keep_model:
+        result['model'] = model
+    return result
+
+
+def result_key(model_type, params, digest, cv=CV_FOLDS, features=FEATURES):
+    return (model_type, tuple(sorted(params.items())), tuple(features), digest, cv)
+
+
+def _combine(model_type, params, holdout, folds):
+    cv_scores = np.array([fold['test_accuracy'] for fold in folds])
+    return {
+        'model_type': model_type,
+        'params': dict(params),
+        'train_accuracy': holdout['train_accuracy'],
+        'test_accuracy': holdout['test_accuracy'],
+        'cv_accuracy_mean': cv_scores.mean(),
+        'cv_accuracy_std': cv_scores.std(),
+        'cv_scores': cv_scores,
+        'confusion_matrix': holdout['confusion_matrix'],
+        'fit_seconds': holdout['fit_seconds'],
+        'predict_seconds': holdout['predict_seconds'],
+        'cv_fit_seconds': sum(fold['fit_seconds'] for fold in folds),
+    }
+
+
+def _arrays(df, features, target, cv):
+    y = df[target].to_numpy()
+    return df[features].to_numpy(dtype=float), y, _splits(y, cv)
+
+
+def _evaluate(todo, X, y, splits, features, cv, n_jobs, keep_models):
+    """Run every fit for the ``todo`` configs in one joblib pass; returns (results, holdout models)."""
+    tasks = [(key, fold) for key in todo for fold in splits]
+    outputs = Parallel(n_jobs=n_jobs or -1)(
+        delayed(_run_task)(*todo[key], X, y, features, *splits[fold], holdout=fold is None,
+                           keep_model=keep_models and fold is None)
+        for key, fold in tasks)
+    by_key = {}
+    for (key, fold), output in zip(tasks, outputs):
+        by_key.setdefault(key, {})[fold] = output
+    models = {key: by_key[key][None].pop('model') for key in todo} if keep_models else {}
+    results = {key: _combine(model_type, params, by_key[key][None], [by_key[key][f] for f in range(cv)])
+               for key, (model_type, params) in todo.items()}
+    return results, models
+
+
+def _claim(keys):
+    """Split ``keys`` into those this thread must compute and futures for those already being computed."""
+    mine, theirs = [], {}
+    with _lock:
+        for key in keys:
+            if key in _inflight:
+                theirs[key] = _inflight[key]
+            elif key not in mine:
+                _inflight[key] = Future()
+                mine.append(key)
+    return mine, theirs
+
+
+def _publish(values):
+    """Hand ``values`` (key -> value or exception) to anyone waiting and stop tracking those keys."""
+    with _lock:
+        futures = {key: _inflight.pop(key) for key in values}
+    for key, value in values.items():
+        if isinstance(value, BaseException):
+            futures[key].set_exception(value)
+        else:
+            futures[key].set_result(value)
+
+
+def _kept_model(key, model_type, params, df, features, target, cv):
+    """The downloadable estimator for ``key``: shared if another session already has it, else refit."""
+    model = _kept.get(key)
+    if model is not None:
+        return model
+    model_key = ('model',) + key
+    mine, theirs = _claim([model_key])
+    if theirs:
+        return theirs[model_key].result()
+    try:
+        X, y, splits = _arrays(df, features, target, cv)
+        model = _fit(model_type, params, X, y, features, splits[None][0])
+    except BaseException as err:
+        _publish({model_key: err})
+        raise
+    _keep(key, model)
+    _publish({model_key: model})
+    return model
+
+
+def _keep(key, model):
+    with _lock:
+        _kept.clear()
+        _kept[key] = model
+
+
+def evaluate_models(df, configs, cv=CV_FOLDS, features=FEATURES, target=TARGET, n_jobs=None, keep_models=False):
+    """Evaluate ``configs`` (a list of ``(model_type, params)``) and return one result dict each.
+
+    Every config gets a fit on the page's usual train/test split (train/test
+    accuracy, confusion matrix, timings) plus ``cv``-fold stratified
+    cross-validation. All fits for all uncached configs run in one joblib
+    pass on its reusable loky worker pool (``n_jobs=1`` runs them in this
+    process); the feature matrix is memory-mapped into the workers rather
+    than copied per task. Results are metrics only, memoized by model,
+    params and a hash of the data. A config that another session is already
+    evaluating is waited for rather than run twice; nothing else waits.
+    With ``keep_models`` a second list with each config's estimator fitted
+    on the train split is returned too. Stochastic estimators are seeded, so
+    a refit matches the reported metrics, and the last estimator handed out
+    is shared with the next session that asks for it.
+    """
+    digest = data_hash(df, features, target)
+    keys = [result_key(model_type, params, digest, cv, features) for model_type, params in configs]
+    configs_by_key = dict(zip(keys, configs))
+    found = {key: _results[key] for key in keys if key in _results}
+    models = {}
+    missing = [key for key in configs_by_key if key not in found]
+    if missing:
+        mine, theirs = _claim(missing)
+        if mine:
+            todo = {key: configs_by_key[key] for key in mine}
+            try:
+                results, models = _evaluate(todo, *_arrays(df, features, target, cv), features, cv, n_jobs,
+                                            keep_models)
+            except BaseException as err:
+                _publish({key: err for key in mine})
+                raise
+            with _lock:
+                # results for older versions of the data are never asked for again
+                for stale in [k for k in _results if k[3] != digest]:
+                    del _results[stale]
+                _results.update(results)
+            found.update(results)
+            _publish(results)
+        for key, future in theirs.items():
+            found[key] = future.result()
+    results = [found[key] for key in keys]
+    if not keep_models:
+        return results
+    for key in keys:
+        if key not in models:
+            models[key] = _kept_model(key, *configs_by_key[key], df, features, target, cv)
+    if _kept.get(keys[-1]) is not models[keys[-1]]:
+        _keep(keys[-1], models[keys[-1]])
+    return results, [models[key] for key in keys]
+
+
+def evaluate_model(df, model_type, params=None, keep_model=False, **kwargs):
+    """Result dict for one model, or ``(result, fitted model)`` with ``keep_model``."""
+    if keep_model:
+        results, models = evaluate_models(df, [(model_type, params or {})], keep_models=True, **kwargs)
+        return results[0], models[0]
+    return evaluate_models(df, [(model_type, params or {})], **kwargs)[0]
+
+
+def all_model_configs(k_values=KNN_K_VALUES):
+    """Every model on the Modeling page, with KNN swept over ``k_values``."""
+    configs = [('KNN', {'n_neighbors': k}) for k in k_values]
+    return configs + [('Logistic Regression', {}), ('Random Forest', {})]
+
+
+def model_label(result):
+    if result['model_type'] == 'KNN':
+        return f"KNN (k={result['params']['n_neighbors']})"
+    return result['model_type']
+
+
+def comparison_table(results):
+    """Side-by-side accuracy and timing of evaluated models, best cross-validated accuracy first."""
+    table = pd.DataFrame([{
+        'Model': model_label(result),
+        'Train Accuracy (%)': round(result['train_accuracy'] * 100, 2),
+        'Test Accuracy (%)': round(result['test_accuracy'] * 100, 2),
+        'CV Accuracy (%)': round(result['cv_accuracy_mean'] * 100, 2),
+        'CV Std (%)': round(result['cv_accuracy_std'] * 100, 2),
+        'Fit Time (ms)': round(result['fit_seconds'] * 1000, 1),
+    } for result in results])
+    if table.empty:
+        return table
+    return table.drop_duplicates('Model').sort_values('CV Accuracy (%)', ascending=False).reset_index(drop=True)
+
+
+def clear_results():
+    with _lock:
+        _results.clear()
+        _kept.clear()
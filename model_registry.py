@@ -0,0 +1,175 @@
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.neighbors import KNeighborsClassifier
+
+from data_loader import DATA_PATH, load_data
+from instrumentation import timed
+
+# Must be in order that the model was trained on
+FEATURES = ['age', 'dailyrate', 'distancefromhome', 'environmentsatisfaction', 'hourlyrate', 'jobinvolvement', 'jobsatisfaction', 'monthlyincome', 'monthlyrate', 'numcompaniesworked', 'percentsalaryhike', 'performancerating', 'relationshipsatisfaction', 'stockoptionlevel', 'totalworkingyears', 'trainingtimeslastyear', 'worklifebalance', 'yearsatcompany', 'yearsincurrentrole', 'yearssincelastpromotion', 'yearswithcurrmanager']
+TARGET = 'attrition'
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+# the artifact belongs to the code, so it is found from any working directory (the data path
+# is relative to the app's working directory; the CLIs resolve it against REPO_DIR)
+MODEL_PATH = os.path.join(REPO_DIR, 'data', 'trained_model.pkl')
+MODEL_META_PATH = os.path.join(REPO_DIR, 'data', 'trained_model.json')
+
+MODEL_TYPES = {
+    'KNN': KNeighborsClassifier,
+    'Logistic Regression': LogisticRegression,
+    'Random Forest': RandomForestClassifier,
+}
+
+# fitted estimators shared by every streamlit session in this process
+_models = {}
+_lock = threading.Lock()
+# data hashes memoized per frame object, so a shared frame is only hashed once
+_hashes = {}
+
+
+def data_hash(df, features=FEATURES, target=TARGET):
+    """Content hash of the feature and target columns of ``df``."""
+    cols = tuple(features) + (target,)
+    memo_key = (id(df), cols)
+    memo = _hashes.get(memo_key)
+    if memo is not None and memo[0]() is df:
+        return memo[1]
+    row_hashes = pd.util.hash_pandas_object(df[list(cols)], index=False).to_numpy()
+    digest = hashlib.sha1(row_hashes.tobytes()).hexdigest()
+    _hashes[memo_key] = (weakref.ref(df), digest)
+    weakref.finalize(df, _hashes.pop, memo_key, None)
+    return digest
+
+
+def model_key(model_type, params, features, digest):
+    return (model_type, tuple(sorted((params or {}).items())), tuple(features), digest)
+
+
+def _load_artifact(model_type, params, features):
+    """Return the pickled model if it matches this configuration, else None."""
+    if model_type != 'Logistic Regression' or not os.path.exists(MODEL_PATH):
+        return None
+    try:
+        with open(MODEL_PATH, 'rb') as model_file:
+            model = pickle.load(model_file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(model, LogisticRegression):
+        return None
+    wanted = LogisticRegression(**(params or {})).get_params()
+    if {k: v for k, v in model.get_params().items() if k != 'warm_start'} != \
+            {k: v for k, v in wanted.items() if k != 'warm_start'}:
+        return None
+    if hasattr(model, 'feature_names_in_') and list(model.feature_names_in_) != list(features):
+        return None
+    return model
+
+
+def _artifact_digest():
+    try:
+        with open(MODEL_META_PATH) as meta_file:
+            return json.load(meta_file).get('data_hash')
+    except (OSError, ValueError):
+        return None
+
+
+def save_artifact(model, digest, features=FEATURES, path=MODEL_PATH, meta_path=MODEL_META_PATH):
+    """Pickle a fitted model to data/trained_model.pkl with a sidecar describing its training data."""
+    # write to temp files first so a concurrent reader never sees half a pickle
+    tmp_model = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_model, 'wb') as model_file:
+        pickle.dump(model, model_file)
+    tmp_meta = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_meta, 'w') as meta_file:
+        json.dump({'data_hash': digest, 'features': list(features)}, meta_file, indent=2)
+    os.replace(tmp_model, path)
+    os.replace(tmp_meta, meta_path)
+
+
+def _fit(model_type, params, df, features, target, digest, use_artifact):
+    model = None
+    if use_artifact and _artifact_digest() == digest:
+        # the artifact was trained on exactly this data, use it as is
+        model = _load_artifact(model_type, params, features)
+    if model is None:
+        # always a fresh fit, so the same key gives the same model in every process
+        model = MODEL_TYPES[model_type](**(params or {}))
+        model.fit(df[features], df[target])
+    return model
+
+
+def get_model(df, model_type='Logistic Regression', params=None, features=FEATURES, target=TARGET,
+              use_artifact=True):
+    """Return a fitted model for this configuration, fitting only on a cache miss.
+
+    Models are keyed on type, hyperparameters, feature list and a hash of the
+    training data, so a rerun with unchanged inputs is a dictionary lookup.
+    For logistic regression the data/trained_model.pkl artifact is reused when it
+    was trained on the same data. The artifact is never written from here; run
+    ``python model_registry.py`` to refit and save it.
+    """
+    digest = data_hash(df, features, target)
+    key = model_key(model_type, params, features, digest)
+    model = _models.get(key)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(key)
+        if model is None:
+            with timed(f'model.fit.{model_type}'):
+                model = _fit(model_type, params, df, features, target, digest, use_artifact)
+            _models[key] = model
+    return model
+
+
+def clear_models():
+    with _lock:
+        _models.clear()
+
+
+def predict_proba(model, X):
+    """Probability of attrition (class 1) for each row of ``X``.
+
+    Linear models are scored directly with numpy, which skips sklearn's
+    per-call input validation and keeps single-row predictions well under a
+    millisecond. Other models fall back to ``model.predict_proba``.
+    """
+    if isinstance(model, LogisticRegression) and model.coef_.shape[0] == 1:
+        values = X[list(model.feature_names_in_)].to_numpy(dtype=float) \
+            if hasattr(model, 'feature_names_in_') else np.asarray(X, dtype=float)
+        scores = values @ model.coef_[0] + model.intercept_[0]
+        return 1.0 / (1.0 + np.exp(-scores))
+    return model.predict_proba(X)[:, 1]
+
+
+def predict(model, X, threshold=0.5):
+    return (predict_proba(model, X) > threshold).astype(int)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refit the logistic regression on the current data and save it "
+                                                 "as data/trained_model.pkl.")
+    parser.add_argument('--data', default=os.path.join(REPO_DIR, DATA_PATH), help="CSV to train on")
+    parser.add_argument('--model', default=MODEL_PATH, help="where to save the model")
+    args = parser.parse_args(argv)
+
+    df = load_data(args.data, use_cache=False)
+    model = MODEL_TYPES['Logistic Regression']().fit(df[FEATURES], df[TARGET])
+    meta_path = f"{os.path.splitext(args.model)[0]}.json"
+    save_artifact(model, data_hash(df), path=args.model, meta_path=meta_path)
+    print(f"Saved {model} trained on {len(df)} rows to {args.model}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+"""Keep an attrition model current by training only on rows appended to the CSV.
+
+Usage:
+    python online_model.py            # ingest new rows and print the drift report
+    python online_model.py --reset    # forget the saved state and retrain from the start of the file
+"""
+import argparse
+import copy
+import hashlib
+import io
+import os
+import pickle
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+from data_loader import DATA_PATH
+from model_registry import FEATURES, REPO_DIR, TARGET
+
+ONLINE_MODEL_PATH = 'data/online_model.pkl'
+# every HOLDOUT_EVERY-th row (by position in the file) is held out and never trained on
+HOLDOUT_EVERY = 5
+MAX_HOLDOUT_ROWS = 20_000
+# passes of partial_fit over each new batch
+EPOCHS = 5
+CHUNKSIZE = 100_000
+DRIFT_THRESHOLD = 0.05
+RANDOM_STATE = 42
+# bytes before the saved offset that are hashed to notice a rewritten file
+FINGERPRINT_BYTES = 4096
+READ_BLOCK_BYTES = 1 << 20
+# appended data the Predictions page learns before predicting; more than this waits for `python online_model.py`
+MAX_REQUEST_BYTES = 8 << 20
+
+_lock = threading.Lock()
+# loaded states by path, reused until the file's mtime/size change
+_states = {}
+
+
+def new_state(source=DATA_PATH):
+    return {
+        'source': os.path.abspath(source),
+        'header': None,
+        'fingerprint': None,
+        'offset': 0,
+        'rows_seen': 0,
+        'scaler': StandardScaler(),
+        'model': SGDClassifier(loss='log_loss', alpha=0.001, average=True, random_state=RANDOM_STATE),
+        'holdout_X': np.empty((0, len(FEATURES))),
+        'holdout_y': np.empty(0, dtype=np.int64),
+        'holdout_seen': 0,
+        'history': [],
+    }
+
+
+def load_state(path=ONLINE_MODEL_PATH, source=DATA_PATH):
+    """The saved online model state, or a fresh one if there is none for ``source``.
+
+    The unpickled state is cached per file version and shared, so treat it as read-only.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return new_state(source)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _states.get(path)
+    if cached is not None and cached[0] == version:
+        state = cached[1]
+    else:
+        try:
+            with open(path, 'rb') as state_file:
+                state = pickle.load(state_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return new_state(source)
+        _states[path] = (version, state)
+    if state.get('source') != os.path.abspath(source):
+        return new_state(source)
+    return state
+
+
+def save_state(state, path=ONLINE_MODEL_PATH):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as state_file:
+        pickle.dump(state, state_file)
+    os.replace(tmp_path, path)
+    _states.pop(path, None)
+
+
+def is_fitted(state):
+    return hasattr(state['model'], 'coef_')
+
+
+def _fingerprint(data_file, offset):
+    """Hashes of the first data line and of the bytes just before ``offset`` (only what was consumed)."""
+    data_file.seek(0)
+    data_file.readline()
+    first_line = data_file.readline()
+    if data_file.tell() > offset:
+        first_line = b''
+    start = max(0, offset - FINGERPRINT_BYTES)
+    data_file.seek(start)
+    tail = data_file.read(offset - start)
+    return hashlib.sha1(first_line).hexdigest(), hashlib.sha1(tail).hexdigest()
+
+
+def _rewritten(state, data_file, header):
+    """True if the file no longer starts with what ``state`` has already read."""
+    if state['header'] is None:
+        return False
+    if header != state['header'] or os.fstat(data_file.fileno()).st_size < state['offset']:
+        return True
+    # older states have no fingerprint; the header and size checks are all they get
+    return state.get('fingerprint') not in (None, _fingerprint(data_file, state['offset']))
+
+
+class _Bounded(io.RawIOBase):
+    """The next ``size`` bytes of ``raw``, so the CSV parser stops before a line that is still being written."""
+
+    def __init__(self, raw, size):
+        self._raw = raw
+        self._left = size
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        view = memoryview(buffer)[:self._left]
+        read = self._raw.readinto(view)
+        self._left -= read
+        return read
+
+
+def _last_line_end(data_file, start):
+    """Offset just past the last newline at or after ``start`` (``start`` itself if there is none)."""
+    end = os.fstat(data_file.fileno()).st_size
+    while end > start:
+        block_start = max(start, end - READ_BLOCK_BYTES)
+        data_file.seek(block_start)
+        newline = data_file.read(end - block_start).rfind(b'\n')
+        if newline >= 0:
+            return block_start + newline + 1
+        end = block_start
+    return start
+
+
+def _rows_between(source, names, start, end):
+    with open(source, 'rb') as data_file:
+        data_file.seek(start)
+        reader = io.BufferedReader(_Bounded(data_file, end - start), READ_BLOCK_BYTES)
+        yield from pd.read_csv(reader, header=None, names=names, chunksize=CHUNKSIZE)
+
+
+def _read_new_rows(state, source):
+    """Rows appended to ``source`` since ``state['offset']``, as (header, chunks, new offset).
+
+    Only complete lines are consumed, so a file that is being appended to
+    while we read is picked up where we left off next time. The new rows are
+    streamed from disk ``CHUNKSIZE`` at a time. If the file shrank, its
+    header changed, or its first data line or the bytes before the offset
+    changed, it was rewritten, and the state is reset.
+    """
+    with open(source, 'rb') as data_file:
+        header_line = data_file.readline()
+        header = header_line.decode().rstrip('\r\n')
+        if _rewritten(state, data_file, header):
+            state.update(new_state(source))
+        start = max(state['offset'], len(header_line))
+        end = _last_line_end(data_file, start)
+        state['fingerprint'] = _fingerprint(data_file, end)
+    if end == start:
+        return header, [], start
+    names = pd.read_csv(io.StringIO(header), nrows=0).columns.tolist()
+    return header, _rows_between(source, names, start, end), end
+
+
+def pending_bytes(state, source=DATA_PATH):
+    """Bytes appended to ``source`` that ``state`` hasn't read, or None if it never read the file or it was rewritten."""
+    with open(source, 'rb') as data_file:
+        header = data_file.readline().decode().rstrip('\r\n')
+        if state['header'] is None or _rewritten(state, data_file, header):
+            return None
+        return os.fstat(data_file.fileno()).st_size - state['offset']
+
+
+def is_current(state, source=DATA_PATH):
+    """True if ``state`` has already read all of ``source`` and the file wasn't rewritten since."""
+    return pending_bytes(state, source) == 0
+
+
+def _accuracy(state, X, y):
+    if not is_fitted(state) or len(y) == 0:
+        return None
+    return float((state['model'].predict(state['scaler'].transform(X)) == y).mean())
+
+
+def _add_holdout(state, X, y, rng):
+    """Reservoir-sample held-out rows so the holdout set stays bounded."""
+    free = max(0, min(len(y), MAX_HOLDOUT_ROWS - len(state['holdout_y'])))
+    state['holdout_X'] = np.concatenate([state['holdout_X'], X[:free]])
+    state['holdout_y'] = np.concatenate([state['holdout_y'], y[:free]])
+    # each later row replaces a random slot with probability MAX_HOLDOUT_ROWS / rows seen so far
+    seen = state['holdout_seen'] + np.arange(free + 1, len(y) + 1)
+    slots = rng.integers(seen)
+    replace = slots < MAX_HOLDOUT_ROWS
+    state['holdout_X'][slots[replace]] = X[free:][replace]
+    state['holdout_y'][slots[replace]] = y[free:][replace]
+    state['holdout_seen'] += len(y)
+
+
+def _train_on(state, X, y, rng):
+    state['scaler'].partial_fit(X)
+    X = state['scaler'].transform(X)
+    for _ in range(EPOCHS):
+        order = rng.permutation(len(y))
+        state['model'].partial_fit(X[order], y[order], classes=[0, 1])
+
+
+def update(source=DATA_PATH, path=ONLINE_MODEL_PATH, wait=True):
+    """Train the online model on rows added since the last update and report accuracy drift.
+
+    Cost is proportional to the number of new rows: the CSV is read from the
+    byte offset where the previous update stopped. The report compares the
+    model's accuracy on the held-out rows before and after the update, and
+    the previous model's accuracy on the new rows (how well it coped with
+    today's data) against its held-out accuracy. With ``wait=False`` it
+    returns None at once if another update is already running.
+    """
+    if not _lock.acquire(blocking=wait):
+        return None
+    try:
+        start = time.perf_counter()
+        # the loaded state is shared with readers, so train on a copy
+        state = copy.deepcopy(load_state(path, source))
+        rng = np.random.default_rng(RANDOM_STATE + state['rows_seen'])
+        header, chunks, offset = _read_new_rows(state, source)
+        holdout_before = _accuracy(state, state['holdout_X'], state['holdout_y'])
+        rows_added = trained = 0
+        new_correct = new_scored = 0
+        for chunk in chunks:
+            positions = np.arange(state['rows_seen'], state['rows_seen'] + len(chunk))
+            state['rows_seen'] += len(chunk)
+            rows_added += len(chunk)
+            complete = chunk[FEATURES + [TARGET]].notna().all(axis=1).to_numpy()
+            X = chunk.loc[complete, FEATURES].to_numpy(dtype=float)
+            y = chunk.loc[complete, TARGET].to_numpy(dtype=np.int64)
+            positions = positions[complete]
+            if len(y) == 0:
+                continue
+            new_accuracy = _accuracy(state, X, y)
+            if new_accuracy is not None:
+                new_correct += new_accuracy * len(y)
+                new_scored += len(y)
+            is_holdout = positions % HOLDOUT_EVERY == 0
+            _add_holdout(state, X[is_holdout], y[is_holdout], rng)
+            if (~is_holdout).any():
+                _train_on(state, X[~is_holdout], y[~is_holdout], rng)
+                trained += int((~is_holdout).sum())
+        state['header'] = header
+        state['offset'] = offset
+        holdout_after = _accuracy(state, state['holdout_X'], state['holdout_y'])
+        new_rows_accuracy = new_correct / new_scored if new_scored else None
+        drift = None
+        if new_rows_accuracy is not None and holdout_before is not None:
+            drift = new_rows_accuracy - holdout_before
+        report = {
+            'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'rows_added': rows_added,
+            'rows_trained': trained,
+            'total_rows': state['rows_seen'],
+            'holdout_rows': len(state['holdout_y']),
+            'holdout_accuracy_before': holdout_before,
+            'holdout_accuracy_after': holdout_after,
+            'new_rows_accuracy': new_rows_accuracy,
+            'drift': drift,
+            'drift_detected': drift is not None and drift < -DRIFT_THRESHOLD,
+            'seconds': time.perf_counter() - start,
+        }
+        if rows_added:
+            state['history'].append(report)
+            save_state(state, path)
+        return report
+    finally:
+        _lock.release()
+
+
+def predict_proba(state, X):
+    """Probability of attrition for each row of ``X`` from the online model."""
+    values = state['scaler'].transform(X[FEATURES].to_numpy(dtype=float))
+    return state['model'].predict_proba(values)[:, 1]
+
+
+class OnlineModel:
+    """A trained state behind the ``predict_proba`` interface that model_registry and batch_scoring use.
+
+    ``pending_bytes`` is how much of the data file it hasn't learned yet (None if the file was rewritten).
+    """
+
+    def __init__(self, state, pending_bytes=0):
+        self.state = state
+        self.pending_bytes = pending_bytes
+
+    def predict_proba(self, X):
+        proba = predict_proba(self.state, X)
+        return np.column_stack([1 - proba, proba])
+
+    def __repr__(self):
+        return f"Incremental {self.state['model']}"
+
+
+def current_model(source=DATA_PATH, path=ONLINE_MODEL_PATH):
+    """The online model with small appends learned first, or None if it has never been trained.
+
+    Only up to ``MAX_REQUEST_BYTES`` of new rows are learned here, so a page
+    rerun never trains on the whole history or waits for another update; the
+    first training, a rewritten file or a big batch of new rows is left to
+    ``python online_model.py`` and the model is served as it is meanwhile.
+    Checking for new rows costs a stat and a few small reads, so this is cheap
+    to call on every rerun.
+    """
+    state = load_state(path, source)
+    if not is_fitted(state):
+        return None
+    pending = pending_bytes(state, source)
+    # an update already running elsewhere isn't waited for either
+    if pending and pending <= MAX_REQUEST_BYTES and update(source, path, wait=False) is not None:
+        state = load_state(path, source)
+        pending = pending_bytes(state, source)
+    return OnlineModel(state, pending)
+
+
+def reset(path=ONLINE_MODEL_PATH):
+    with _lock:
+        if os.path.exists(path):
+            os.remove(path)
+        _states.pop(path, None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the online attrition model with newly appended rows.")
+    parser.add_argument('--data', default=os.path.join(REPO_DIR, DATA_PATH),
+                        help="CSV that new attrition records are appended to")
+    parser.add_argument('--state', default=os.path.join(REPO_DIR, ONLINE_MODEL_PATH),
+                        help="where the online model state is kept")
+    parser.add_argument('--reset', action='store_true', help="discard the saved state and retrain from scratch")
+    args = parser.parse_args(argv)
+
+    if args.reset:
+        reset(args.state)
+    report = update(args.data, args.state)
+    for key, value in report.items():
+        print(f"{key}: {value:.4f}" if isinstance(value, float) else f"{key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from batch_scoring import score_file
+from model_registry import FEATURES, TARGET
+
+
+@pytest.fixture
+def employees():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.integers(0, 50, size=(500, len(FEATURES))), columns=FEATURES)
+    df[TARGET] = rng.integers(0, 2, size=len(df))
+    df['employeenumber'] = np.arange(len(df))
+    return df
+
+
+@pytest.fixture
+def model(employees):
+    return LogisticRegression(max_iter=1000).fit(employees[FEATURES], employees[TARGET])
+
+
+def _score_csv(source, model, **kwargs):
+    out = io.StringIO()
+    counts = score_file(source, out, model=model, out_fmt='csv', **kwargs)
+    return counts, pd.read_csv(io.StringIO(out.getvalue()))
+
+
+@pytest.mark.parametrize('chunksize', [37, 1000])
+def test_output_is_ranked_riskiest_first(employees, model, chunksize):
+    (written, skipped), scored = _score_csv(employees, model, chunksize=chunksize)
+    assert (written, skipped) == (len(employees), 0)
+    assert scored['risk_rank'].tolist() == list(range(1, len(employees) + 1))
+    assert scored['attrition_probability'].is_monotonic_decreasing
+    expected = model.predict_proba(employees[FEATURES])[:, 1]
+    np.testing.assert_allclose(scored['attrition_probability'], expected[scored['employeenumber']])
+
+
+def test_input_order(employees, model):
+    _, scored = _score_csv(employees, model, chunksize=37, ranked=False)
+    assert scored['employeenumber'].tolist() == employees['employeenumber'].tolist()
+    assert sorted(scored['risk_rank']) == list(range(1, len(employees) + 1))
+
+
+@pytest.mark.parametrize('chunksize', [7, 37, 1000])
+def test_top_matches_head_of_full_ranking(employees, model, chunksize):
+    _, full = _score_csv(employees, model, chunksize=chunksize)
+    (written, _), top = _score_csv(employees, model, chunksize=chunksize, top=25)
+    assert written == 25
+    pd.testing.assert_frame_equal(top, full.head(25))
+
+
+def test_rows_with_missing_features_are_skipped(employees, model):
+    employees = employees.astype({'age': float})
+    employees.loc[[3, 250], 'age'] = np.nan
+    (written, skipped), scored = _score_csv(employees, model, chunksize=37)
+    assert (written, skipped) == (len(employees) - 2, 2)
+    assert not scored['employeenumber'].isin([3, 250]).any()
+    assert scored['risk_rank'].max() == written
+
+
+def test_parquet_round_trip(employees, model, tmp_path):
+    source, dest = tmp_path / 'employees.parquet', tmp_path / 'scored.parquet'
+    employees.to_parquet(source, index=False)
+    written, _ = score_file(str(source), str(dest), model=model, chunksize=37)
+    scored = pd.read_parquet(dest)
+    assert len(scored) == written == len(employees)
+    assert scored['risk_rank'].tolist() == list(range(1, len(employees) + 1))
+    assert list(scored.columns[:len(employees.columns)]) == list(employees.columns)
+
+
+def test_missing_columns_raise(employees, model):
+    with pytest.raises(ValueError, match='age'):
+        score_file(employees.drop(columns='age'), io.StringIO(), model=model)
@@ -0,0 +1,61 @@
+import gzip
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_export
+from data_export import export_bytes, to_bytes
+
+
+@pytest.fixture
+def employees():
+    return pd.DataFrame({'age': np.arange(1000), 'department': ['Sales', 'R&D', 'HR', 'IT'] * 250})
+
+
+@pytest.fixture(autouse=True)
+def fresh_exports():
+    data_export.clear_exports()
+    yield
+    data_export.clear_exports()
+
+
+@pytest.mark.parametrize('fmt', list(data_export.EXPORT_FORMATS))
+def test_round_trip_in_chunks(employees, fmt):
+    data = to_bytes(employees, fmt, chunksize=64)
+    if fmt == 'Parquet':
+        restored = pd.read_parquet(io.BytesIO(data))
+    else:
+        restored = pd.read_csv(io.BytesIO(gzip.decompress(data) if fmt == 'CSV (gzip)' else data))
+    pd.testing.assert_frame_equal(restored, employees)
+
+
+def test_filters_and_columns(employees):
+    data = export_bytes(employees, 'v1', columns=['age'], filters={'department': {'HR', 'IT'}})
+    restored = pd.read_csv(io.BytesIO(data))
+    assert list(restored.columns) == ['age'] and len(restored) == 500
+
+
+def test_cached_per_version_and_options(employees):
+    data = export_bytes(employees, 'v1', filters={'department': ['HR', 'IT']})
+    assert export_bytes(employees, 'v1', filters={'department': ['IT', 'HR']}) is data
+    assert export_bytes(employees, 'v2', filters={'department': ['HR', 'IT']}) is not data
+
+
+def test_cache_is_capped_by_total_bytes(employees, monkeypatch):
+    size = len(to_bytes(employees))
+    monkeypatch.setattr(data_export, 'MAX_CACHED_BYTES', 2 * size)
+    first = export_bytes(employees, 'v1')
+    export_bytes(employees, 'v2')
+    assert export_bytes(employees, 'v1') is first
+    # v1 was used last, so v2 is the one evicted
+    export_bytes(employees, 'v3')
+    assert list(data_export._exports) == [('v1', 'CSV', (), ()), ('v3', 'CSV', (), ())]
+    assert data_export._cached_bytes == 2 * size
+
+
+def test_exports_over_the_cap_are_not_cached(employees, monkeypatch):
+    monkeypatch.setattr(data_export, 'MAX_CACHED_BYTES', 100)
+    export_bytes(employees, 'v1')
+    assert not data_export._exports and data_export._cached_bytes == 0
@@ -0,0 +1,55 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_loader
+from data_loader import load_data
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'employees.csv'
+    pd.DataFrame({'age': np.arange(20, 40), 'department': ['Sales', 'R&D'] * 10}).to_csv(path, index=False)
+    yield str(path)
+    data_loader.clear_cache()
+
+
+def _append(path, line):
+    with open(path, 'a') as data_file:
+        data_file.write(line)
+
+
+def test_parsed_once_per_file_version(source):
+    df = load_data(source)
+    assert load_data(source) is df
+    assert df['department'].dtype == 'category' and df['age'].dtype == np.int8
+
+    _append(source, '99,HR\n')
+    changed = load_data(source)
+    assert len(changed) == len(df) + 1 and changed['age'].iloc[-1] == 99
+    # the old version isn't kept next to the new one
+    assert [key[1:] for key in data_loader._frames] == [data_loader._file_key(source)[1:]]
+
+
+@pytest.mark.skipif(not data_loader.HAS_PYARROW, reason="the parquet cache needs pyarrow")
+def test_parquet_cache_is_reused_and_replaced(source):
+    df = load_data(source)
+    cache_files = data_loader._stale_cache_files(source)
+    assert cache_files == [data_loader._cache_path(source, data_loader.data_version(source))]
+
+    # a new process starts from the parquet file, not the CSV
+    data_loader._frames.clear()
+    pd.testing.assert_frame_equal(load_data(source), df)
+
+    _append(source, '99,HR\n')
+    load_data(source)
+    assert data_loader._stale_cache_files(source) == [data_loader._cache_path(source, data_loader.data_version(source))]
+    assert not os.path.exists(cache_files[0])
+
+
+def test_without_cache_nothing_is_written(source):
+    load_data(source, use_cache=False)
+    assert data_loader._stale_cache_files(source) == []
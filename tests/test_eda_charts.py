@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import eda_charts
+
+
+@pytest.fixture
+def employees():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'age': rng.integers(18, 61, size=20_000),
+        'monthlyincome': rng.normal(6500, 2000, size=20_000),
+        'attrition': (rng.random(20_000) < 0.05).astype(int),
+    })
+
+
+@pytest.fixture(autouse=True)
+def fresh_aggregates():
+    eda_charts.clear_aggregates()
+    yield
+    eda_charts.clear_aggregates()
+
+
+def test_histogram_counts_every_row(employees):
+    agg = eda_charts.histogram_data(employees, 'monthlyincome', hue='attrition')
+    assert len(agg) == 2 * eda_charts.HIST_BINS
+    assert agg.groupby('attrition')['count'].sum().to_dict() == \
+        employees['attrition'].astype(str).value_counts().to_dict()
+
+
+def test_small_integer_columns_get_one_bar_per_value(employees):
+    agg = eda_charts.histogram_data(employees, 'age')
+    assert agg['age'].tolist() == list(range(18, 61))
+    assert agg['count'].tolist() == employees['age'].value_counts().sort_index().tolist()
+
+
+def test_box_statistics(employees):
+    stats = eda_charts.box_data(employees, 'monthlyincome').iloc[0]
+    assert stats['median'] == pytest.approx(employees['monthlyincome'].median())
+    assert stats['count'] == len(employees)
+    assert len(stats['outliers']) <= eda_charts.MAX_BOX_OUTLIERS
+
+
+def test_scatter_sample_is_capped_and_keeps_rare_groups(employees):
+    sample = eda_charts.scatter_sample(employees, 'age', 'monthlyincome', hue='attrition', max_points=400)
+    # the rare group is topped up to its floor of 400 // 8 points on top of the shares
+    assert len(sample) <= 400 + 400 // 8
+    assert (sample['attrition'] == '1').sum() >= 400 // 8
+    small = employees.head(100)
+    assert len(eda_charts.scatter_sample(small, 'age', 'monthlyincome', max_points=400)) == 100
+
+
+def test_density_counts_every_row(employees):
+    _, _, counts = eda_charts.density_data(employees, 'age', 'monthlyincome', hue='attrition')
+    assert sum(z.sum() for z in counts.values()) == len(employees)
+
+
+def test_figures_share_aggregates_per_version(employees, monkeypatch):
+    calls = []
+    histogram_data = eda_charts.histogram_data
+    monkeypatch.setattr(eda_charts, 'histogram_data', lambda *args: calls.append(args) or histogram_data(*args))
+    eda_charts.histogram_figure(employees, 'v1', 'age', 'Age')
+    eda_charts.histogram_figure(employees, 'v1', 'age', 'Age again')
+    assert len(calls) == 1
+    eda_charts.histogram_figure(employees, 'v2', 'age', 'Age')
+    assert len(calls) == 2
@@ -0,0 +1,116 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import model_evaluation
+from model_evaluation import CV_FOLDS, evaluate_model, evaluate_models
+from model_registry import FEATURES, TARGET
+
+
+@pytest.fixture
+def employees():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.integers(0, 50, size=(300, len(FEATURES))), columns=FEATURES)
+    df[TARGET] = (df['age'] + rng.integers(0, 20, size=len(df)) > 40).astype(int)
+    return df
+
+
+@pytest.fixture(autouse=True)
+def fresh_results():
+    model_evaluation.clear_results()
+    yield
+    model_evaluation.clear_results()
+
+
+@pytest.fixture
+def tasks(monkeypatch):
+    """Record the model type of every fit, and let a test hold fits of one model type until released."""
+    tasks = SimpleNamespace(calls=[], hold=None, started=threading.Event(), release=threading.Event())
+    run_task = model_evaluation._run_task
+
+    def recording_task(model_type, *args, **kwargs):
+        tasks.calls.append(model_type)
+        if model_type == tasks.hold:
+            tasks.started.set()
+            assert tasks.release.wait(30)
+        return run_task(model_type, *args, **kwargs)
+
+    monkeypatch.setattr(model_evaluation, '_run_task', recording_task)
+    return tasks
+
+
+def _holdout_accuracy(model, df):
+    X, y, splits = model_evaluation._arrays(df, FEATURES, TARGET, CV_FOLDS)
+    test = splits[None][1]
+    return model.score(pd.DataFrame(X[test], columns=FEATURES), y[test])
+
+
+def test_results_are_memoized(employees, tasks):
+    first = evaluate_model(employees, 'KNN', {'n_neighbors': 5}, n_jobs=1)
+    assert len(tasks.calls) == CV_FOLDS + 1
+    assert evaluate_model(employees, 'KNN', {'n_neighbors': 5}, n_jobs=1) is first
+    assert len(tasks.calls) == CV_FOLDS + 1
+    evaluate_model(employees, 'KNN', {'n_neighbors': 7}, n_jobs=1)
+    assert len(tasks.calls) == 2 * (CV_FOLDS + 1)
+    assert 'model' not in first
+
+
+def test_results_for_old_data_are_dropped(employees):
+    evaluate_model(employees, 'KNN', n_jobs=1)
+    changed = employees.assign(age=employees['age'] + 1)
+    evaluate_model(changed, 'KNN', n_jobs=1)
+    assert len(model_evaluation._results) == 1
+
+
+def test_identical_concurrent_requests_run_once(employees, tasks):
+    tasks.hold = 'Logistic Regression'
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(evaluate_model(employees, 'Logistic Regression',
+                                                                             n_jobs=1)))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    assert tasks.started.wait(30)
+    tasks.release.set()
+    for thread in threads:
+        thread.join(30)
+    assert len(results) == 3 and all(result is results[0] for result in results)
+    assert len(tasks.calls) == CV_FOLDS + 1
+
+
+def test_other_requests_do_not_wait(employees, tasks):
+    evaluate_model(employees, 'KNN', {'n_neighbors': 5}, keep_model=True, n_jobs=1)
+    tasks.hold = 'Random Forest'
+    slow = threading.Thread(target=evaluate_model, args=(employees, 'Random Forest'), kwargs={'n_jobs': 1})
+    slow.start()
+    try:
+        assert tasks.started.wait(30)
+        # a cached result, its shared model and an unrelated evaluation all finish while the forest is held
+        _, model = evaluate_model(employees, 'KNN', {'n_neighbors': 5}, keep_model=True, n_jobs=1)
+        assert list(model_evaluation._kept.values()) == [model]
+        evaluate_model(employees, 'Logistic Regression', n_jobs=1)
+        assert slow.is_alive()
+    finally:
+        tasks.release.set()
+        slow.join(30)
+
+
+def test_kept_model_matches_reported_metrics(employees):
+    forest, forest_model = evaluate_model(employees, 'Random Forest', keep_model=True, n_jobs=1)
+    assert _holdout_accuracy(forest_model, employees) == forest['test_accuracy']
+    # another model takes the one kept slot, so asking for the forest again refits it
+    evaluate_model(employees, 'KNN', keep_model=True, n_jobs=1)
+    cached, refit = evaluate_model(employees, 'Random Forest', keep_model=True, n_jobs=1)
+    assert cached is forest and refit is not forest_model
+    assert _holdout_accuracy(refit, employees) == forest['test_accuracy']
+    assert evaluate_model(employees, 'Random Forest', keep_model=True, n_jobs=1)[1] is refit
+
+
+def test_comparison_covers_every_config(employees):
+    results = evaluate_models(employees, model_evaluation.all_model_configs(k_values=[1, 3]), n_jobs=1)
+    table = model_evaluation.comparison_table(results)
+    assert set(table['Model']) == {'KNN (k=1)', 'KNN (k=3)', 'Logistic Regression', 'Random Forest'}
+    assert table['CV Accuracy (%)'].is_monotonic_decreasing
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import online_model
+from model_registry import FEATURES, TARGET
+
+
+def _employees(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.integers(0, 50, size=(n_rows, len(FEATURES))), columns=FEATURES)
+    df[TARGET] = (df['age'] + rng.integers(0, 20, size=n_rows) > 40).astype(int)
+    return df
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / 'employees.csv'), str(tmp_path / 'online_model.pkl')
+
+
+def _append(path, df):
+    df.to_csv(path, mode='a', header=False, index=False)
+
+
+def test_update_reads_only_appended_rows(paths):
+    source, state_path = paths
+    _employees(300).to_csv(source, index=False)
+    first = online_model.update(source, state_path)
+    assert (first['rows_added'], first['total_rows']) == (300, 300)
+    assert first['rows_trained'] + first['holdout_rows'] == 300
+
+    assert online_model.update(source, state_path)['rows_added'] == 0
+
+    _append(source, _employees(120, seed=1))
+    second = online_model.update(source, state_path)
+    assert (second['rows_added'], second['total_rows']) == (120, 420)
+    assert second['holdout_accuracy_before'] is not None
+    assert len(online_model.load_state(state_path, source)['history']) == 2
+
+
+def test_incomplete_last_line_waits_for_the_rest(paths):
+    source, state_path = paths
+    _employees(50).to_csv(source, index=False)
+    online_model.update(source, state_path)
+    line = _employees(1, seed=2).to_csv(header=False, index=False)
+    with open(source, 'a') as data_file:
+        data_file.write(line[:10])
+    assert online_model.update(source, state_path)['rows_added'] == 0
+    with open(source, 'a') as data_file:
+        data_file.write(line[10:])
+    assert online_model.update(source, state_path)['rows_added'] == 1
+
+
+def test_truncated_file_starts_over(paths):
+    source, state_path = paths
+    _employees(300).to_csv(source, index=False)
+    online_model.update(source, state_path)
+    _employees(100, seed=3).to_csv(source, index=False)
+    report = online_model.update(source, state_path)
+    assert (report['rows_added'], report['total_rows']) == (100, 100)
+
+
+def test_rewritten_file_with_same_header_starts_over(paths):
+    source, state_path = paths
+    _employees(300).to_csv(source, index=False)
+    online_model.update(source, state_path)
+    # same header and at least as long, but different rows
+    _employees(400, seed=4).to_csv(source, index=False)
+    report = online_model.update(source, state_path)
+    assert (report['rows_added'], report['total_rows']) == (400, 400)
+
+
+def test_holdout_reservoir_stays_bounded(paths, monkeypatch):
+    source, state_path = paths
+    monkeypatch.setattr(online_model, 'MAX_HOLDOUT_ROWS', 30)
+    _employees(500).to_csv(source, index=False)
+    online_model.update(source, state_path)
+    _append(source, _employees(500, seed=5))
+    report = online_model.update(source, state_path)
+    state = online_model.load_state(state_path, source)
+    assert report['holdout_rows'] == len(state['holdout_y']) == 30
+    assert state['holdout_seen'] == 1000 // online_model.HOLDOUT_EVERY
+    assert report['rows_trained'] == 500 - 500 // online_model.HOLDOUT_EVERY
+
+
+def test_current_model_learns_small_appends_before_predicting(paths):
+    source, state_path = paths
+    _employees(200).to_csv(source, index=False)
+    online_model.update(source, state_path)
+    model = online_model.current_model(source, state_path)
+    assert (model.state['rows_seen'], model.pending_bytes) == (200, 0)
+    assert online_model.current_model(source, state_path).state is model.state
+
+    _append(source, _employees(50, seed=6))
+    model = online_model.current_model(source, state_path)
+    assert (model.state['rows_seen'], model.pending_bytes) == (250, 0)
+    proba = model.predict_proba(_employees(5, seed=7))
+    assert proba.shape == (5, 2)
+    np.testing.assert_allclose(proba.sum(axis=1), 1)
+
+
+def test_current_model_never_trains_on_the_whole_file(paths):
+    source, state_path = paths
+    _employees(200).to_csv(source, index=False)
+    assert online_model.current_model(source, state_path) is None
+    online_model.update(source, state_path)
+    _employees(300, seed=8).to_csv(source, index=False)
+    model = online_model.current_model(source, state_path)
+    assert (model.state['rows_seen'], model.pending_bytes) == (200, None)
+
+
+def test_current_model_leaves_big_appends_to_the_cli(paths, monkeypatch):
+    source, state_path = paths
+    _employees(200).to_csv(source, index=False)
+    online_model.update(source, state_path)
+    monkeypatch.setattr(online_model, 'MAX_REQUEST_BYTES', 100)
+    _append(source, _employees(50, seed=9))
+    model = online_model.current_model(source, state_path)
+    assert model.state['rows_seen'] == 200 and model.pending_bytes > 100
+    assert online_model.update(source, state_path)['rows_added'] == 50
+
+
+def test_rows_are_read_in_chunks(paths, monkeypatch):
+    source, state_path = paths
+    monkeypatch.setattr(online_model, 'CHUNKSIZE', 64)
+    monkeypatch.setattr(online_model, 'READ_BLOCK_BYTES', 100)
+    _employees(300).to_csv(source, index=False)
+    with open(source, 'a') as data_file:
+        data_file.write('12,3')
+    report = online_model.update(source, state_path)
+    assert (report['rows_added'], report['total_rows']) == (300, 300)
+    assert online_model.pending_bytes(online_model.load_state(state_path, source), source) == 4